@@ -5,6 +5,7 @@ from __future__ import annotations
 import csv
 import gc
 import os
+import threading
 import time
 from datetime import datetime
 from zoneinfo import ZoneInfo
@@ -150,6 +151,26 @@ def _symbols_csv_valid(path: str) -> bool:
     return False
 
 
+def _start_quiver_warmup() -> None:
+    """Download the heavy Quiver endpoints in the background at startup.
+
+    The first scan then finds them cached (or joins the in-flight download)
+    instead of fetching them one by one on the first symbols it evaluates.
+    """
+    if not config.ENABLE_QUIVER:
+        return
+
+    def _warm() -> None:
+        try:
+            from signals.quiver_ingest import initialize_quiver_caches
+
+            initialize_quiver_caches()
+        except Exception as exc:
+            log_event(f"CACHE Quiver warm-up failed: {exc}", event="ERROR")
+
+    threading.Thread(target=_warm, name="quiver-warmup", daemon=True).start()
+
+
 def _ensure_symbols_csv() -> None:
     if _symbols_csv_valid(SYMBOLS_PATH):
         log_event("SCAN symbols.csv present, using existing universe", event="SCAN")
@@ -170,6 +191,7 @@ def equity_scheduler_loop(interval_sec: int = 15, max_symbols: int | None = None
     """
 
     _ensure_symbols_csv()
+    _start_quiver_warmup()
     log_event("Scheduler loop started (equities, long-only)", event="SCAN")
 
     last_protect_ts = 0.0
@@ -1,12 +1,15 @@
 # fmp_utils.py
 """Helper functions for Financial Modeling Prep (FMP) API.
 These functions serve as backups when primary data sources fail."""
+import logging
 import os
 import time
 import requests
 import config
 from signals.quiver_throttler import throttled_request
 
+logger = logging.getLogger(__name__)
+
 BASE_URL = "https://financialmodelingprep.com/stable"
 
 # Default timeout (seconds) for FMP HTTP requests. Increase if API is slow.
@@ -34,18 +37,16 @@ def _get(endpoint: str, params: dict | None = None, max_retries: int = 3):
             )
             if resp.status_code == 429:
                 wait = 2 ** attempt
-                print(
-                    f"⚠️ FMP rate limit hit ({endpoint}). "
-                    f"Retrying in {wait}s..."
-                )
+                logger.debug("FMP rate limit hit (%s). Retrying in %ss", endpoint, wait)
                 time.sleep(wait)
                 continue
             resp.raise_for_status()
             return resp.json()
         except Exception as e:
-            print(f"⚠️ FMP request failed ({endpoint}): {e}")
             if attempt == max_retries - 1:
+                logger.warning("FMP request failed (%s): %s", endpoint, e)
                 return None
+            logger.debug("FMP request failed (%s): %s", endpoint, e)
             time.sleep(2 ** attempt)
     return None
 
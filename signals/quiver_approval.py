@@ -1,8 +1,15 @@
 # quiver_approval.py
 
-"""Convenient re-exports for Quiver utilities."""
+"""Convenient re-exports for Quiver utilities.
 
-from . import quiver_utils as _quiver
+``quiver_utils`` (and with it ``requests``/``dotenv`` via ``quiver_ingest``)
+is imported on first use so processes that only touch this module's names
+do not pay the Quiver import cost up front.
+"""
+
+from __future__ import annotations
+
+import importlib
 
 __all__ = [
     "is_approved_by_quiver",
@@ -11,22 +18,26 @@ __all__ = [
 ]
 
 
+def _quiver():
+    return importlib.import_module("signals.quiver_utils")
+
+
 def is_approved_by_quiver(symbol: str) -> dict:
     """Proxy to :func:`quiver_utils.is_approved_by_quiver`."""
 
-    return _quiver.is_approved_by_quiver(symbol)
+    return _quiver().is_approved_by_quiver(symbol)
 
 
 def evaluate_quiver_signals(signals: dict, symbol: str = "") -> dict:
     """Proxy to :func:`quiver_utils.evaluate_quiver_signals`."""
 
-    return _quiver.evaluate_quiver_signals(signals, symbol)
+    return _quiver().evaluate_quiver_signals(signals, symbol)
 
 
 def get_all_quiver_signals(symbol: str) -> dict:
     """Proxy to :func:`quiver_utils.get_all_quiver_signals`."""
 
-    return _quiver.get_all_quiver_signals(symbol)
+    return _quiver().get_all_quiver_signals(symbol)
 
 
 def __getattr__(name):
@@ -36,4 +47,6 @@ def __getattr__(name):
     ``signals.quiver_utils`` and have those patches reflected here.
     """
 
-    return getattr(_quiver, name)
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return getattr(_quiver(), name)
@@ -2,21 +2,47 @@
 
 from __future__ import annotations
 
+import atexit
+import logging
 import os
 import random
+import sys
+import threading
 import time
-from datetime import datetime
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
-from signals.quiver_throttler import throttled_request
+from signals.quiver_throttler import (
+    note_rate_limit_headers,
+    note_rate_limited,
+    note_success,
+    throttled_request,
+)
 from utils.cache import get as cache_get, set as cache_set
-from utils.persistent_cache import get as persist_get, set as persist_set
+from utils.persistent_cache import (
+    get as persist_get,
+    get_item as persist_get_item,
+    set as persist_set,
+)
 from utils.logger import log_event, log_once
 
+try:  # pragma: no cover
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
 
 class QuiverRateLimitError(Exception):
     """Raised when the Quiver API responds with a rate limit."""
@@ -33,7 +59,89 @@ QUIVER_BASE_URL = "https://api.quiverquant.com/beta"
 HEADERS = {"Authorization": f"Bearer {QUIVER_API_KEY}"}
 QUIVER_TIMEOUT = int(os.getenv("QUIVER_TIMEOUT", "15"))
 
+# Keep-alive pool so consecutive endpoint fetches reuse the TLS connection to
+# api.quiverquant.com instead of paying a handshake per request.  Failed
+# connects (never reached the server, so no quota spent) are retried by
+# urllib3 right away; 429/5xx stay with safe_quiver_request, which honours
+# Retry-After and the shared token bucket.
+_CONNECT_RETRY = Retry(total=None, connect=2, read=0, status=0, other=0, backoff_factor=0.25)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_CONNECT_RETRY),
+)
+_SESSION.headers.update(HEADERS)
+atexit.register(_SESSION.close)
+
+# Endpoint name -> time.monotonic() deadline until which it is not requested.
 _ENDPOINT_SUPPRESS: dict[str, float] = {}
+_SUPPRESS_LOCK = threading.Lock()
+# Circuit breaker: consecutive failed fetches per endpoint.  The first failure
+# opens the circuit for _BREAKER_RESET_SEC; once it expires the next fetch is a
+# single probe (the single-flight below keeps it single) and each further
+# failure doubles the cooldown up to the endpoint TTL.
+_ENDPOINT_FAILURES: dict[str, int] = {}
+_BREAKER_RESET_SEC = 30.0
+
+# Last good payload per heavy endpoint with its HTTP validators, so a refetch
+# after TTL expiry can be conditional: name -> (etag, last_modified, payload).
+_VALIDATORS: dict[str, tuple[Optional[str], Optional[str], list]] = {}
+# Returned by safe_quiver_request for 304 Not Modified.
+NOT_MODIFIED = object()
+# Stale-while-revalidate: name -> (time.time() of the last fill, payload).
+# Up to twice the TTL old, a miss returns this payload at once and refreshes
+# it in a background thread instead of blocking the caller on the download.
+_LAST_GOOD: dict[str, tuple[float, list]] = {}
+
+
+def _suppress_endpoint(name: str, seconds: float) -> None:
+    with _SUPPRESS_LOCK:
+        _ENDPOINT_SUPPRESS[name] = time.monotonic() + seconds
+
+
+def _record_failure(name: str, max_seconds: float) -> float:
+    """Open the circuit for ``name``; return the cooldown applied."""
+    with _SUPPRESS_LOCK:
+        failures = _ENDPOINT_FAILURES.get(name, 0) + 1
+        _ENDPOINT_FAILURES[name] = failures
+        seconds = min(float(max_seconds), _BREAKER_RESET_SEC * 2 ** (failures - 1))
+        _ENDPOINT_SUPPRESS[name] = time.monotonic() + seconds
+    return seconds
+
+
+def _record_success(name: str) -> None:
+    with _SUPPRESS_LOCK:
+        _ENDPOINT_FAILURES.pop(name, None)
+        _ENDPOINT_SUPPRESS.pop(name, None)
+
+
+def _suppression_left(name: str) -> float:
+    """Seconds until ``name`` may be requested again (0 when not suppressed)."""
+    with _SUPPRESS_LOCK:
+        until = _ENDPOINT_SUPPRESS.get(name)
+        if until is None:
+            return 0.0
+        left = until - time.monotonic()
+        if left <= 0:
+            del _ENDPOINT_SUPPRESS[name]
+            return 0.0
+        return left
+
+# Single-flight for cold heavy endpoints and per-URL requests: endpoint name
+# (or request cache key) -> Event set once the thread that owns the download
+# has filled (or failed to fill) the cache.
+_INFLIGHT: dict[str, threading.Event] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Per-payload ticker index: id(payload) -> (payload, {TICKER: [rows]}).  The
+# payload reference is kept so the id cannot be recycled while indexed.
+_INDEX_CACHE: dict[int, tuple[list, dict[str, list[dict]]]] = {}
+_INDEX_CACHE_MAX = 16
+_INDEX_LOCK = threading.Lock()
+
+# Called with an endpoint payload once a newer one replaces it, so memo
+# tables keyed by payload stop pinning the old list (see on_payload_retired).
+_RETIRE_HOOKS: list = []
 
 
 def _ttl_lot() -> int:
@@ -47,58 +155,376 @@ def _ttl_heavy() -> int:
     return int(cache_cfg.get("quiver_heavy_ttl_sec", 86400))
 
 
+def _ttl_endpoint(name: str) -> int:
+    """TTL of one heavy endpoint: cache.quiver_endpoint_ttl_sec, else quiver_heavy_ttl_sec."""
+    cfg = getattr(config, "_policy", {}) or {}
+    cache_cfg = cfg.get("cache") or {}
+    per_endpoint = cache_cfg.get("quiver_endpoint_ttl_sec") or {}
+    if name in per_endpoint:
+        return int(per_endpoint[name])
+    return _ttl_heavy()
+
+
+def _ttl_request() -> int:
+    cfg = getattr(config, "_policy", {}) or {}
+    cache_cfg = cfg.get("cache") or {}
+    return int(cache_cfg.get("quiver_request_ttl_sec", 900))
+
+
+def _ttl_negative() -> int:
+    cfg = getattr(config, "_policy", {}) or {}
+    cache_cfg = cfg.get("cache") or {}
+    return int(cache_cfg.get("quiver_negative_ttl_sec", 300))
+
+
+def _ttl_wsb() -> int:
+    cfg = getattr(config, "_policy", {}) or {}
+    cache_cfg = cfg.get("cache") or {}
+    return int(cache_cfg.get("quiver_wsb_ttl_sec", 3600))
+
+
+# Cache key schema shared by quiver_ingest and quiver_utils.  Both the in-memory
+# (utils.cache) and on-disk (utils.persistent_cache) layers use these keys.
+CACHE_KEYS = {
+    # Raw cross-ticker payload of one endpoint; TTL = _ttl_endpoint(name).
+    # Per-symbol row slices are not cached separately: index_by_ticker memoizes
+    # them per payload, so ingest_symbol_payload and the feature extractors
+    # share one grouping pass.
+    "endpoint": "quiver:{name}:{day}",
+    # Numeric feature snapshot of one symbol, stored as a value list in
+    # quiver_utils.QUIVER_FEATURE_KEYS order; TTL = cache.symbol_ttl_sec.
+    "symbol_features": "Q_SIG:{symbol}",
+    # Memo of a non-empty answer from an uncached URL (_request_or_default);
+    # memory-only unless the caller asks to persist it (per-symbol WSB).
+    # TTL = cache.quiver_request_ttl_sec, or the caller's (cache.quiver_wsb_ttl_sec).
+    "request": "quiver_req:{url}",
+    # Memory-only negative entry for an uncached URL that returned 404/empty
+    # (the empty payload) or failed (_NEGATIVE); TTL = cache.quiver_negative_ttl_sec.
+    "negative": "quiver_neg:{url}",
+    # On-disk [etag, last_modified, endpoint key] of the heavy payload stored
+    # under that "endpoint" key, so a restart can still refetch conditionally.
+    # No TTL: only read while the endpoint key itself is fresh.
+    "validators": "quiver_val:{name}",
+}
+
+# Stored under a "negative" key when the request failed outright.
+_NEGATIVE = object()
+
+
 def _daily_cache_key(name: str) -> str:
     today = datetime.utcnow().strftime("%Y-%m-%d")
-    return f"quiver:{name}:{today}"
+    return CACHE_KEYS["endpoint"].format(name=name, day=today)
 
 
 # Endpoints that consistently time out get fewer retries to avoid multi-minute startup delays.
 # sec13f/sec13fchanges are quarterly data with weight ≤0.4 — not worth 3×15s per failure.
 _FLAKY_ENDPOINTS = {"live_sec13f", "live_sec13fchanges"}
 
-
-def _cached_heavy_endpoint(name: str, url: str, ttl: int):
-    key = _daily_cache_key(name)
+# Cross-ticker endpoints warmed by initialize_quiver_caches: (cache name, path).
+HEAVY_ENDPOINTS: tuple[tuple[str, str], ...] = (
+    ("live_insiders", "/live/insiders"),
+    ("live_govcontractsall", "/live/govcontractsall"),
+    ("live_govcontracts", "/live/govcontracts"),
+    ("live_housetrading", "/live/housetrading"),
+    ("live_senatetrading", "/live/senatetrading"),
+    ("live_congresstrading", "/live/congresstrading"),
+    ("live_appratings", "/live/appratings"),
+    ("live_patentmomentum", "/live/patentmomentum"),
+    ("live_offexchange", "/live/offexchange"),
+    ("live_sec13f", "/live/sec13f"),
+    ("live_sec13fchanges", "/live/sec13fchanges"),
+)
+
+
+def index_by_ticker(data) -> dict[str, list[dict]]:
+    """Group payload rows by upper-cased ``Ticker``/``ticker``.
+
+    Built once per payload object and memoized, so per-symbol lookups are a
+    dict hit instead of a scan over the whole endpoint.
+    """
+    if not isinstance(data, list):
+        return {}
+    hit = _INDEX_CACHE.get(id(data))
+    if hit is not None and hit[0] is data:
+        return hit[1]
+    index: dict[str, list[dict]] = {}
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        ticker = item.get("Ticker") or item.get("ticker")
+        if ticker:
+            # Interned keys: one shared string per ticker across every
+            # endpoint index, and identity hits on symbol lookups.
+            index.setdefault(sys.intern(str(ticker).upper()), []).append(item)
+    with _INDEX_LOCK:
+        while len(_INDEX_CACHE) >= _INDEX_CACHE_MAX:
+            _INDEX_CACHE.pop(next(iter(_INDEX_CACHE)))
+        _INDEX_CACHE[id(data)] = (data, index)
+    return index
+
+
+def on_payload_retired(hook) -> None:
+    """Register ``hook(payload)``, called when an endpoint payload is replaced."""
+    _RETIRE_HOOKS.append(hook)
+
+
+def _store_last_good(name: str, ts: float, data: list) -> None:
+    """Record ``data`` as the last-good payload of ``name``.
+
+    The payload it replaces is dropped from the ticker index and handed to
+    the :func:`on_payload_retired` hooks.
+    """
+    old = _LAST_GOOD.get(name)
+    _LAST_GOOD[name] = (ts, data)
+    if old is None or old[1] is data:
+        return
+    with _INDEX_LOCK:
+        hit = _INDEX_CACHE.get(id(old[1]))
+        if hit is not None and hit[0] is old[1]:
+            del _INDEX_CACHE[id(old[1])]
+    for hook in _RETIRE_HOOKS:
+        hook(old[1])
+
+
+def _cached_payload(key: str, ttl: int, name: Optional[str] = None):
     data = cache_get(key, ttl)
     if data is not None:
         return data
-    data = persist_get(key, ttl)
+    hit = persist_get_item(key, ttl)
+    if hit is None:
+        return None
+    data, ts = hit
+    cache_set(key, data)
+    if name is not None:
+        _seed_from_disk(name, key, data, ts)
+    return data
+
+
+def _seed_from_disk(name: str, key: str, data: list, ts: float) -> None:
+    """Restore the last-good payload and validators of a payload read from disk.
+
+    Without them the first expiry after a restart could neither serve stale
+    data nor refetch conditionally.
+    """
+    last = _LAST_GOOD.get(name)
+    if last is None or last[0] < ts:
+        _store_last_good(name, ts, data)
+    if name in _VALIDATORS:
+        return
+    stored = persist_get(CACHE_KEYS["validators"].format(name=name))
+    if isinstance(stored, list) and len(stored) == 3 and stored[2] == key:
+        _VALIDATORS[name] = (stored[0], stored[1], data)
+
+
+def _cached_heavy_endpoint(name: str, url: str, ttl: Optional[int] = None):
+    ttl = ttl or _ttl_endpoint(name)
+    key = _daily_cache_key(name)
+    data = _cached_payload(key, ttl, name)
     if data is not None:
-        cache_set(key, data)
         return data
-    now = time.time()
-    suppressed_until = _ENDPOINT_SUPPRESS.get(name)
-    if suppressed_until and now < suppressed_until:
+    stale = _LAST_GOOD.get(name)
+    if stale is not None and time.time() - stale[0] < 2 * ttl:
+        _refresh_in_background(name, url, ttl, key)
+        return stale[1]
+    # Coalesce concurrent misses: the first caller downloads, the rest wait
+    # for it and re-read the cache instead of issuing the same request.
+    event, owner = _claim_inflight(name)
+    if not owner:
+        event.wait()
+        return _cached_payload(key, ttl, name)
+    try:
+        return _fetch_heavy_endpoint(name, url, ttl, key)
+    finally:
+        _release_inflight(name, event)
+
+
+def heavy_endpoint_cached(name: str) -> bool:
+    """True when ``name`` is answered without waiting on a download.
+
+    That is a fresh in-memory payload, a stale one still served while it
+    revalidates, or an open circuit (answered with ``None`` at once).
+    """
+    ttl = _ttl_endpoint(name)
+    if cache_get(_daily_cache_key(name), ttl) is not None:
+        return True
+    stale = _LAST_GOOD.get(name)
+    if stale is not None and time.time() - stale[0] < 2 * ttl:
+        return True
+    return _suppression_left(name) > 0
+
+
+def _claim_inflight(name: str) -> tuple[threading.Event, bool]:
+    with _INFLIGHT_LOCK:
+        event = _INFLIGHT.get(name)
+        owner = event is None
+        if owner:
+            event = _INFLIGHT[name] = threading.Event()
+    return event, owner
+
+
+def _release_inflight(name: str, event: threading.Event) -> None:
+    with _INFLIGHT_LOCK:
+        _INFLIGHT.pop(name, None)
+    event.set()
+
+
+def _refresh_in_background(name: str, url: str, ttl: int, key: str) -> None:
+    if _suppression_left(name) > 0:
+        return  # circuit open: keep serving the stale payload until it closes
+    event, owner = _claim_inflight(name)
+    if not owner:
+        return  # a refresh is already running
+
+    def _run():
+        try:
+            _fetch_heavy_endpoint(name, url, ttl, key)
+        except Exception as exc:  # pragma: no cover - keep the thread quiet
+            logger.debug("Quiver refresco en segundo plano de %s falló: %s", name, exc)
+        finally:
+            _release_inflight(name, event)
+
+    threading.Thread(target=_run, name=f"quiver-refresh-{name}", daemon=True).start()
+
+
+def _fetch_heavy_endpoint(name: str, url: str, ttl: int, key: str):
+    left = _suppression_left(name)
+    if left:
         log_once(
             f"quiver_suppressed_{name}",
-            f"CACHE {name}: salto por suppress hasta {suppressed_until:.0f}",
+            f"CACHE {name}: salto por suppress durante {left:.0f}s más",
             min_interval_sec=60,
         )
         return None
     retries = 1 if name in _FLAKY_ENDPOINTS else 3
+    response_headers: dict = {}
     try:
-        data = safe_quiver_request(url, retries=retries)
+        data = safe_quiver_request(
+            url,
+            retries=retries,
+            headers_extra=_conditional_headers(name),
+            response_headers=response_headers,
+        )
     except QuiverRateLimitError:
-        _ENDPOINT_SUPPRESS[name] = now + ttl
+        cooldown = _record_failure(name, ttl)
         log_event(
-            f"CACHE {name}: suppress por rate limit durante {ttl}s",
+            f"CACHE {name}: suppress por rate limit durante {cooldown:.0f}s",
             event="CACHE",
         )
         return None
     except QuiverTemporaryError:
-        _ENDPOINT_SUPPRESS[name] = now + ttl
+        cooldown = _record_failure(name, ttl)
         log_event(
-            f"CACHE {name}: suppress temporal durante {ttl}s",
+            f"CACHE {name}: suppress temporal durante {cooldown:.0f}s",
             event="CACHE",
         )
         return None
-    if isinstance(data, list):
+    if data is NOT_MODIFIED:
+        # Unchanged since the last download: restart the TTL on the payload
+        # already in memory instead of downloading and parsing it again.
+        validators = _VALIDATORS.get(name)
+        if validators is None:
+            # Validators were dropped while the request was in flight, so
+            # there is no payload to reuse: count it as a failed fetch.
+            cooldown = _record_failure(name, ttl)
+            log_event(
+                f"CACHE {name}: 304 sin payload previo, suppress durante {cooldown:.0f}s",
+                event="CACHE",
+            )
+            return None
+        etag, last_modified, data = validators
+        _record_success(name)
+        _store_last_good(name, time.time(), data)
         cache_set(key, data)
         persist_set(key, data)
+        persist_set(CACHE_KEYS["validators"].format(name=name), [etag, last_modified, key])
+        index_by_ticker(data)
+        log_event(f"CACHE {name}: 304 sin cambios, se reutiliza", event="CACHE")
+    elif isinstance(data, list):
+        _record_success(name)
+        _store_last_good(name, time.time(), data)
+        cache_set(key, data)
+        persist_set(key, data)
+        index_by_ticker(data)
+        _remember_validators(name, response_headers, data, key)
+    elif data is None:
+        # No payload and no error raised: skip the endpoint briefly rather than
+        # re-requesting it on every symbol.
+        _suppress_endpoint(name, _ttl_negative())
     return data
 
 
-def safe_quiver_request(url, retries=3, delay=4):
+def _backoff_wait(attempt: int, delay: float, cap: float) -> float:
+    """Full-jitter backoff: uniform in ``[0, min(cap, delay * 2**attempt)]``.
+
+    Spreading retries over the whole window keeps callers that failed together
+    from retrying together and re-tripping the rate limit.
+    """
+    return random.uniform(0, min(cap, delay * (2**attempt)))
+
+
+def _retry_after_seconds(headers) -> float | None:
+    """Parse ``Retry-After`` (delta-seconds or HTTP-date); ``None`` if absent."""
+    if not isinstance(headers, Mapping):
+        return None
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _decode_json(r):
+    # orjson parses the multi-MB /live/* arrays several times faster than
+    # the stdlib decoder behind ``Response.json``.
+    if orjson is not None and isinstance(r.content, (bytes, bytearray)):
+        return orjson.loads(r.content)
+    return r.json()
+
+
+def _conditional_headers(name: str) -> Optional[dict]:
+    entry = _VALIDATORS.get(name)
+    if entry is None:
+        return None
+    etag, last_modified, _ = entry
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers or None
+
+
+def _remember_validators(name: str, headers, data: list, key: str) -> None:
+    if not isinstance(headers, Mapping):
+        return
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    val_key = CACHE_KEYS["validators"].format(name=name)
+    if etag or last_modified:
+        _VALIDATORS[name] = (etag, last_modified, data)
+        persist_set(val_key, [etag, last_modified, key])
+    else:
+        _VALIDATORS.pop(name, None)
+        persist_set(val_key, None)
+
+
+def safe_quiver_request(
+    url,
+    retries=3,
+    delay=4,
+    cap=60,
+    headers_extra=None,
+    response_headers=None,
+):
     if QUIVER_API_KEY:
         log_once(
             "quiver_api_key_present",
@@ -113,69 +539,137 @@ def safe_quiver_request(url, retries=3, delay=4):
         )
     last_error: Optional[Exception] = None
     for i in range(retries):
+        wait: Optional[float] = None
         try:
-            r = throttled_request(requests.get, url, headers=HEADERS, timeout=QUIVER_TIMEOUT)
+            r = throttled_request(
+                _SESSION.get, url, timeout=QUIVER_TIMEOUT, headers=headers_extra
+            )
+            note_rate_limit_headers(r.headers)
+            if response_headers is not None and isinstance(r.headers, Mapping):
+                response_headers.update(r.headers)
+            if r.status_code == 304:
+                note_success()
+                return NOT_MODIFIED
             if r.ok:
-                return r.json()
+                note_success()
+                return _decode_json(r)
             if r.status_code == 429:
+                note_rate_limited()
                 last_error = QuiverRateLimitError("rate_limit")
-                wait = delay * (2**i)
-                wait += random.uniform(0, delay)
-                print(f"⚠️ Límite de velocidad alcanzado en {url}: código {r.status_code}")
-                print(f"🔄 Reintentando en {wait}s...")
-                time.sleep(wait)
-                continue
-            if r.status_code >= 500:
+                retry_after = _retry_after_seconds(r.headers)
+                if retry_after is not None and retry_after > cap:
+                    # Server asks for a longer pause than we block a scan for;
+                    # give up and let the caller's suppression window cover it.
+                    log_once(
+                        f"quiver_429_{url}",
+                        f"⚠️ Límite de velocidad en {url}: Retry-After {retry_after:.0f}s",
+                        min_interval_sec=60,
+                    )
+                    break
+                if retry_after is not None:
+                    wait = retry_after + random.uniform(0, 1.0)
+                log_once(
+                    f"quiver_429_{url}",
+                    f"⚠️ Límite de velocidad alcanzado en {url}: código 429",
+                    min_interval_sec=60,
+                )
+            elif r.status_code >= 500:
                 last_error = QuiverTemporaryError(f"server_{r.status_code}")
-                print(f"⚠️ Error del servidor en {url}: código {r.status_code}")
-                break
-            if r.status_code == 404:
-                print(f"ℹ️ Datos no encontrados en {url}")
+                logger.debug("Quiver error del servidor en %s: código %s", url, r.status_code)
+            elif r.status_code == 404:
+                logger.debug("Quiver sin datos en %s (404)", url)
                 return []
-            last_error = QuiverTemporaryError(f"http_{r.status_code}")
-            print(f"⚠️ Respuesta inesperada en {url}: código {r.status_code}")
-            break
+            else:
+                # Other 4xx will not succeed on retry.
+                last_error = QuiverTemporaryError(f"http_{r.status_code}")
+                logger.debug("Quiver respuesta inesperada en %s: código %s", url, r.status_code)
+                break
         except requests.exceptions.Timeout:
             last_error = QuiverTemporaryError("timeout")
-            print(f"⏱️ Timeout en {url} tras {QUIVER_TIMEOUT}s")
+            logger.debug("Quiver timeout en %s tras %ss", url, QUIVER_TIMEOUT)
         except Exception as e:
             last_error = QuiverTemporaryError(str(e))
-            print(f"⚠️ Error en {url}: {e}")
-        wait = delay * (2**i)
-        wait += random.uniform(0, delay)
-        print(f"🔄 Reintentando en {wait}s...")
+            logger.debug("Quiver error en %s: %s", url, e)
+        if i == retries - 1:
+            break  # no point sleeping before giving up
+        if wait is None:
+            wait = _backoff_wait(i, delay, cap)
+        logger.debug("Quiver reintento en %.1fs: %s", wait, url)
         time.sleep(wait)
-    print(f"❌ Fallo final en {url}. Se devuelve None.")
+    log_once(
+        f"quiver_fail_{url}",
+        f"❌ Fallo final en {url} ({last_error}). Se devuelve None.",
+        min_interval_sec=60,
+    )
     if last_error:
         raise last_error
     return None
 
 
-def _request_or_default(url: str, default=None):
+def _memoized_request(req_key: str, neg_key: str, default, ttl: int, persist: bool = False):
+    """Return ``(hit, value)`` from the per-URL positive/negative memo."""
+    data = cache_get(req_key, ttl)
+    if data is None and persist:
+        data = persist_get(req_key, ttl)
+        if data is not None:
+            cache_set(req_key, data)
+    if data is not None:
+        return True, data
+    hit = cache_get(neg_key, _ttl_negative())
+    if hit is not None:
+        return True, default if hit is _NEGATIVE else hit
+    return False, None
+
+
+def _request_or_default(url: str, default=None, ttl: Optional[int] = None, persist: bool = False):
+    # Uncached endpoints: memoize answers per URL, and remember 404/empty
+    # answers and failures for a shorter while, so repeated lookups for the
+    # same URL stay off the throttle.  ``persist`` also keeps non-empty
+    # answers on disk so they survive a restart.
+    ttl = ttl or _ttl_request()
+    req_key = CACHE_KEYS["request"].format(url=url)
+    neg_key = CACHE_KEYS["negative"].format(url=url)
+    hit, data = _memoized_request(req_key, neg_key, default, ttl, persist)
+    if hit:
+        return data
+    # Same single-flight as the heavy endpoints, keyed per URL: threads
+    # asking for the same symbol at once share one request.
+    event, owner = _claim_inflight(req_key)
+    if not owner:
+        event.wait()
+        hit, data = _memoized_request(req_key, neg_key, default, ttl, persist)
+        return data if hit else default
     try:
-        return safe_quiver_request(url)
-    except (QuiverRateLimitError, QuiverTemporaryError):
-        return default
+        try:
+            data = safe_quiver_request(url)
+        except (QuiverRateLimitError, QuiverTemporaryError):
+            cache_set(neg_key, _NEGATIVE)
+            return default
+        if data:
+            cache_set(req_key, data)
+            if persist:
+                persist_set(req_key, data)
+        else:
+            cache_set(neg_key, _NEGATIVE if data is None else data)
+        return data
+    finally:
+        _release_inflight(req_key, event)
 
 
 def fetch_live_insiders():
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint("live_insiders", f"{QUIVER_BASE_URL}/live/insiders", ttl)
+    return _cached_heavy_endpoint("live_insiders", f"{QUIVER_BASE_URL}/live/insiders")
 
 
 def fetch_live_govcontracts():
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint("live_govcontracts", f"{QUIVER_BASE_URL}/live/govcontracts", ttl)
+    return _cached_heavy_endpoint("live_govcontracts", f"{QUIVER_BASE_URL}/live/govcontracts")
 
 
 def fetch_live_housetrading():
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint("live_housetrading", f"{QUIVER_BASE_URL}/live/housetrading", ttl)
+    return _cached_heavy_endpoint("live_housetrading", f"{QUIVER_BASE_URL}/live/housetrading")
 
 
 def fetch_live_twitter():
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint("live_twitter", f"{QUIVER_BASE_URL}/live/twitter", ttl)
+    return _cached_heavy_endpoint("live_twitter", f"{QUIVER_BASE_URL}/live/twitter")
 
 
 def fetch_live_appratings():
@@ -183,8 +677,7 @@ def fetch_live_appratings():
 
 
 def fetch_live_appratings_cached():
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint("live_appratings", f"{QUIVER_BASE_URL}/live/appratings", ttl)
+    return _cached_heavy_endpoint("live_appratings", f"{QUIVER_BASE_URL}/live/appratings")
 
 
 def fetch_live_sec13f():
@@ -192,8 +685,7 @@ def fetch_live_sec13f():
 
 
 def fetch_live_sec13f_cached():
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint("live_sec13f", f"{QUIVER_BASE_URL}/live/sec13f", ttl)
+    return _cached_heavy_endpoint("live_sec13f", f"{QUIVER_BASE_URL}/live/sec13f")
 
 
 def fetch_live_sec13fchanges():
@@ -201,13 +693,11 @@ def fetch_live_sec13fchanges():
 
 
 def fetch_live_sec13fchanges_cached():
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint("live_sec13fchanges", f"{QUIVER_BASE_URL}/live/sec13fchanges", ttl)
+    return _cached_heavy_endpoint("live_sec13fchanges", f"{QUIVER_BASE_URL}/live/sec13fchanges")
 
 
 def fetch_live_senatetrading():
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint("live_senatetrading", f"{QUIVER_BASE_URL}/live/senatetrading", ttl)
+    return _cached_heavy_endpoint("live_senatetrading", f"{QUIVER_BASE_URL}/live/senatetrading")
 
 
 def fetch_live_senatetrading_cached():
@@ -215,8 +705,7 @@ def fetch_live_senatetrading_cached():
 
 
 def fetch_live_congresstrading():
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint("live_congresstrading", f"{QUIVER_BASE_URL}/live/congresstrading", ttl)
+    return _cached_heavy_endpoint("live_congresstrading", f"{QUIVER_BASE_URL}/live/congresstrading")
 
 
 def fetch_live_congresstrading_cached():
@@ -229,10 +718,7 @@ def fetch_live_govcontractsall():
 
 def fetch_live_govcontractsall_cached():
     """Individual contracts with exact dates — better than quarterly aggregates."""
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint(
-        "live_govcontractsall", f"{QUIVER_BASE_URL}/live/govcontractsall", ttl
-    )
+    return _cached_heavy_endpoint("live_govcontractsall", f"{QUIVER_BASE_URL}/live/govcontractsall")
 
 
 def fetch_live_lobbying():
@@ -245,10 +731,7 @@ def fetch_live_offexchange():
 
 def fetch_live_offexchange_cached():
     """Yesterday's off-exchange short activity (DPI = % shares short)."""
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint(
-        "live_offexchange", f"{QUIVER_BASE_URL}/live/offexchange", ttl
-    )
+    return _cached_heavy_endpoint("live_offexchange", f"{QUIVER_BASE_URL}/live/offexchange")
 
 
 def fetch_live_patentmomentum():
@@ -256,8 +739,7 @@ def fetch_live_patentmomentum():
 
 
 def fetch_live_patentmomentum_cached():
-    ttl = _ttl_heavy()
-    return _cached_heavy_endpoint("live_patentmomentum", f"{QUIVER_BASE_URL}/live/patentmomentum", ttl)
+    return _cached_heavy_endpoint("live_patentmomentum", f"{QUIVER_BASE_URL}/live/patentmomentum")
 
 
 def fetch_live_patentdrift(symbol: str):
@@ -281,9 +763,25 @@ def fetch_live_allpatents(symbol: str, date_from: str, date_to: str):
 
 
 def fetch_historical_wallstreetbets(symbol: str):
-    return _request_or_default(
-        f"{QUIVER_BASE_URL}/historical/wallstreetbets/{symbol.upper()}"
-    )
+    """Per-symbol WSB history; memoized and kept on disk with a short TTL.
+
+    Goes through the per-URL memo rather than ``_cached_heavy_endpoint`` so
+    that thousands of symbols do not each get a heavy-endpoint index,
+    circuit breaker, validators and stale-while-revalidate entry.
+    """
+    return _request_or_default(_wsb_url(symbol), ttl=_ttl_wsb(), persist=True)
+
+
+def wallstreetbets_cached(symbol: str) -> bool:
+    """True when :func:`fetch_historical_wallstreetbets` is a memory hit."""
+    url = _wsb_url(symbol)
+    if cache_get(CACHE_KEYS["request"].format(url=url), _ttl_wsb()) is not None:
+        return True
+    return cache_get(CACHE_KEYS["negative"].format(url=url), _ttl_negative()) is not None
+
+
+def _wsb_url(symbol: str) -> str:
+    return f"{QUIVER_BASE_URL}/historical/wallstreetbets/{symbol.upper()}"
 
 
 def fetch_historical_congresstrading(symbol: str):
@@ -301,6 +799,10 @@ def fetch_historical_senatetrading(symbol: str):
 def ingest_symbol_payload(symbol: str) -> dict[str, dict[str, list[dict]]]:
     """Return raw Quiver payloads filtered to ``symbol`` without scoring."""
     sym = symbol.upper()
+
+    def rows(data) -> list[dict]:
+        return index_by_ticker(data).get(sym, [])
+
     insiders = [
         {
             "date": item.get("Date"),
@@ -309,8 +811,7 @@ def ingest_symbol_payload(symbol: str) -> dict[str, dict[str, list[dict]]]:
             "price": item.get("Price"),
             "owner": item.get("Owner"),
         }
-        for item in (fetch_live_insiders() or [])
-        if item.get("Ticker") == sym
+        for item in rows(fetch_live_insiders())
     ]
     gov_contracts = [
         {
@@ -318,8 +819,7 @@ def ingest_symbol_payload(symbol: str) -> dict[str, dict[str, list[dict]]]:
             "amount": item.get("Amount"),
             "agency": item.get("Agency"),
         }
-        for item in (fetch_live_govcontracts() or [])
-        if item.get("Ticker") == sym
+        for item in rows(fetch_live_govcontracts())
     ]
     house_trades = [
         {
@@ -327,8 +827,7 @@ def ingest_symbol_payload(symbol: str) -> dict[str, dict[str, list[dict]]]:
             "transaction": item.get("Transaction"),
             "amount": item.get("Amount"),
         }
-        for item in (fetch_live_housetrading() or [])
-        if item.get("Ticker") == sym
+        for item in rows(fetch_live_housetrading())
     ]
     twitter = [
         {
@@ -336,8 +835,7 @@ def ingest_symbol_payload(symbol: str) -> dict[str, dict[str, list[dict]]]:
             "followers": item.get("Followers"),
             "tweet": item.get("Tweet"),
         }
-        for item in (fetch_live_twitter() or [])
-        if item.get("Ticker") == sym
+        for item in rows(fetch_live_twitter())
     ]
     app_ratings = [
         {
@@ -345,29 +843,25 @@ def ingest_symbol_payload(symbol: str) -> dict[str, dict[str, list[dict]]]:
             "rating": item.get("Rating"),
             "count": item.get("Count"),
         }
-        for item in (fetch_live_appratings_cached() or [])
-        if item.get("Ticker") == sym
+        for item in rows(fetch_live_appratings_cached())
     ]
     patent_momentum = [
         {
             "date": item.get("date") or item.get("Date"),
             "momentum": item.get("momentum"),
         }
-        for item in (fetch_live_patentmomentum() or [])
-        if item.get("ticker") == sym
+        for item in rows(fetch_live_patentmomentum())
     ]
     sec13f = [
         {"date": item.get("ReportDate") or item.get("Date"), "ticker": item.get("Ticker")}
-        for item in (fetch_live_sec13f() or [])
-        if item.get("Ticker") == sym
+        for item in rows(fetch_live_sec13f())
     ]
     sec13f_changes = [
         {
             "date": item.get("ReportDate") or item.get("Date"),
             "change_pct": item.get("Change_Pct"),
         }
-        for item in (fetch_live_sec13fchanges() or [])
-        if item.get("Ticker") == sym
+        for item in rows(fetch_live_sec13fchanges())
     ]
     return {
         sym: {
@@ -383,27 +877,23 @@ def ingest_symbol_payload(symbol: str) -> dict[str, dict[str, list[dict]]]:
     }
 
 
-def initialize_quiver_caches():
-    ttl = _ttl_heavy()
-    print("Descargando datos de insiders...")
-    _cached_heavy_endpoint("live_insiders", f"{QUIVER_BASE_URL}/live/insiders", ttl)
-    print("Descargando contratos gubernamentales individuales (govcontractsall)...")
-    _cached_heavy_endpoint("live_govcontractsall", f"{QUIVER_BASE_URL}/live/govcontractsall", ttl)
-    print("Descargando contratos gubernamentales trimestrales (govcontracts)...")
-    _cached_heavy_endpoint("live_govcontracts", f"{QUIVER_BASE_URL}/live/govcontracts", ttl)
-    print("Descargando datos de housetrading...")
-    _cached_heavy_endpoint("live_housetrading", f"{QUIVER_BASE_URL}/live/housetrading", ttl)
-    print("Descargando datos de senatetrading...")
-    _cached_heavy_endpoint("live_senatetrading", f"{QUIVER_BASE_URL}/live/senatetrading", ttl)
-    print("Descargando datos de congresstrading...")
-    _cached_heavy_endpoint("live_congresstrading", f"{QUIVER_BASE_URL}/live/congresstrading", ttl)
-    print("Descargando datos de app ratings...")
-    _cached_heavy_endpoint("live_appratings", f"{QUIVER_BASE_URL}/live/appratings", ttl)
-    print("Descargando datos de patent momentum...")
-    _cached_heavy_endpoint("live_patentmomentum", f"{QUIVER_BASE_URL}/live/patentmomentum", ttl)
-    print("Descargando actividad off-exchange (short interest)...")
-    _cached_heavy_endpoint("live_offexchange", f"{QUIVER_BASE_URL}/live/offexchange", ttl)
-    print("Descargando datos de SEC 13F...")
-    _cached_heavy_endpoint("live_sec13f", f"{QUIVER_BASE_URL}/live/sec13f", ttl)
-    print("Descargando datos de SEC 13F changes...")
-    _cached_heavy_endpoint("live_sec13fchanges", f"{QUIVER_BASE_URL}/live/sec13fchanges", ttl)
+def initialize_quiver_caches() -> dict[str, bool]:
+    """Warm every heavy endpoint; return ``{name: ok}``.
+
+    Downloads overlap on a small thread pool but go through the normal
+    ``_cached_heavy_endpoint`` path, so they share the token bucket, retries,
+    single-flight, circuit breaker and validators with on-demand fetches.
+    """
+    log_event(f"CACHE descargando {len(HEAVY_ENDPOINTS)} endpoints Quiver", event="CACHE")
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="quiver-warmup") as pool:
+        results = list(
+            pool.map(
+                lambda item: _cached_heavy_endpoint(item[0], f"{QUIVER_BASE_URL}{item[1]}"),
+                HEAVY_ENDPOINTS,
+            )
+        )
+    status = {name: isinstance(data, list) for (name, _), data in zip(HEAVY_ENDPOINTS, results)}
+    failed = [name for name, ok in status.items() if not ok]
+    if failed:
+        log_event(f"CACHE endpoints Quiver sin datos: {', '.join(failed)}", event="CACHE")
+    return status
@@ -1,32 +1,125 @@
 # quiver_throttler.py
 
+import os
 import time
-import random
 import threading
+from collections.abc import Mapping
 
-# Variables globales
-REQUEST_LOCK = threading.Lock()
-LAST_REQUEST_TIME = 0
-RATE_LIMIT_DELAY = 2.0  # segundos entre peticiones, ajustable según tu plan
+from utils.logger import log_once
 
 
-def throttled_request(request_func, *args, **kwargs):
+def _rate_limit_delay(default: float = 2.0) -> float:
+    """Segundos entre peticiones; ``QUIVER_RPS`` (peticiones/seg) lo ajusta al plan contratado."""
+    try:
+        rps = float(os.getenv("QUIVER_RPS", ""))
+    except ValueError:
+        return default
+    return 1.0 / rps if rps > 0 else default
+
+
+RATE_LIMIT_DELAY = _rate_limit_delay()  # segundos entre peticiones en régimen estable
+RATE_LIMIT_BURST = 3  # peticiones seguidas permitidas tras un periodo de inactividad
+# Hasta cuándo (time.monotonic()) no enviar más peticiones porque el servidor
+# indicó que la cuota está agotada (X-RateLimit-Remaining / X-RateLimit-Reset).
+PAUSE_UNTIL = 0.0
+_PAUSE_LOCK = threading.Lock()
+
+
+class TokenBucket:
     """
-    Ejecuta una petición a la API de forma segura, asegurando que no se violen los límites de velocidad.
-    Aplica un retardo entre llamadas sucesivas.
+    Cubo de tokens: permite ráfagas de ``burst`` peticiones y después
+    ``rate`` peticiones por segundo. Usa ``time.monotonic`` para no verse
+    afectado por ajustes del reloj del sistema.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = rate / 8
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        # Se reserva el token bajo el lock (puede quedar en negativo) y se
+        # duerme fuera de él, así los hilos no se serializan durante la espera.
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    # AIMD como en el control de congestión TCP: un 429 reduce el ritmo a la
+    # mitad y cada respuesta correcta lo recupera poco a poco hasta el máximo.
+    def backoff(self) -> float:
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            return self.rate
+
+    def recover(self) -> None:
+        if self.rate >= self.max_rate:
+            return
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+_BUCKET = TokenBucket(rate=1.0 / RATE_LIMIT_DELAY, burst=RATE_LIMIT_BURST)
+
+
+def note_rate_limited() -> None:
+    """Registra un 429: reduce a la mitad el ritmo de peticiones."""
+    rate = _BUCKET.backoff()
+    log_once(
+        "quiver_rate_backoff",
+        f"⚠️ Quiver 429: ritmo reducido a {rate:.2f} req/s",
+        min_interval_sec=60,
+    )
+
+
+def note_success() -> None:
+    """Registra una respuesta correcta: recupera el ritmo gradualmente."""
+    _BUCKET.recover()
+
+
+def note_rate_limit_headers(headers) -> None:
+    """
+    Lee las cabeceras de cuota de la respuesta y, si la cuota restante está
+    agotada, pausa las siguientes peticiones hasta el reset en lugar de
+    esperar a recibir un 429.
     """
-    global LAST_REQUEST_TIME
+    global PAUSE_UNTIL
 
-    with REQUEST_LOCK:
-        now = time.time()
-        time_since_last = now - LAST_REQUEST_TIME
+    if not isinstance(headers, Mapping):
+        return
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return
+    try:
+        remaining = float(remaining)
+        reset = float(reset)
+    except (TypeError, ValueError):
+        return
+    if remaining > 0:
+        return
+    # X-RateLimit-Reset puede venir como epoch o como segundos hasta el reset.
+    delay = reset - time.time() if reset > 1_000_000_000 else reset
+    delay = min(max(delay, 0.0), 60.0)
+    with _PAUSE_LOCK:
+        PAUSE_UNTIL = max(PAUSE_UNTIL, time.monotonic() + delay)
 
-        if time_since_last < RATE_LIMIT_DELAY:
-            sleep_time = RATE_LIMIT_DELAY - time_since_last + random.uniform(0, 1.0)
-            time.sleep(sleep_time)
 
-        try:
-            result = request_func(*args, **kwargs)
-            return result
-        finally:
-            LAST_REQUEST_TIME = time.time()
+def throttled_request(request_func, *args, **kwargs):
+    """
+    Ejecuta una petición a la API de forma segura, asegurando que no se violen los límites de velocidad.
+    Respeta la pausa indicada por el servidor y toma un token del cubo compartido.
+    """
+    pause = PAUSE_UNTIL - time.monotonic()
+    if pause > 0:
+        time.sleep(pause)
+    _BUCKET.acquire()
+    return request_func(*args, **kwargs)
@@ -8,121 +8,294 @@ raw numeric features so scoring can live in one place.
 
 from __future__ import annotations
 
+import functools
+import heapq
+import logging
+import threading
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+import numpy as np
+import pandas as pd
+
 import config
 from signals import quiver_ingest
 from utils.cache import get as cache_get, set as cache_set
 from utils.persistent_cache import get as persist_get, set as persist_set
 
+logger = logging.getLogger(__name__)
+
+
+# Memoized policy values; cleared whenever config._policy is replaced (reload,
+# tests swapping policies).  In-place edits of the policy dict are not seen.
+_POLICY_MEMO: dict[tuple[str, str], object] = {}
+_POLICY_MEMO_SOURCE: object = None
+
+
+def _policy_value(section: str, key: str, default, cast):
+    global _POLICY_MEMO_SOURCE
+    policy = getattr(config, "_policy", {}) or {}
+    if policy is not _POLICY_MEMO_SOURCE:
+        _POLICY_MEMO.clear()
+        _POLICY_MEMO_SOURCE = policy
+    memo_key = (section, key)
+    try:
+        return _POLICY_MEMO[memo_key]
+    except KeyError:
+        pass
+    value = cast((policy.get(section) or {}).get(key, default))
+    _POLICY_MEMO[memo_key] = value
+    return value
+
 
 def _ttl_symbol() -> int:
-    cfg = getattr(config, "_policy", {}) or {}
-    return int(((cfg.get("cache") or {}).get("symbol_ttl_sec", 600)))
+    return _policy_value("cache", "symbol_ttl_sec", 600, int)
 
 
 def _freshness_days() -> int:
-    cfg = getattr(config, "_policy", {}) or {}
-    return int(((cfg.get("signals") or {}).get("freshness_days_quiver", 7)))
+    return _policy_value("signals", "freshness_days_quiver", 7, int)
 
 
 def _freshness_days_gov_contracts() -> int:
-    cfg = getattr(config, "_policy", {}) or {}
-    return int(((cfg.get("signals") or {}).get("freshness_days_gov_contracts", 45)))
+    return _policy_value("signals", "freshness_days_gov_contracts", 45, int)
 
 
 def _freshness_days_gov_contracts_large() -> int:
     """Large contracts (>= threshold) stay relevant longer: multi-year execution."""
-    cfg = getattr(config, "_policy", {}) or {}
-    return int(((cfg.get("signals") or {}).get("freshness_days_gov_contracts_large", 90)))
+    return _policy_value("signals", "freshness_days_gov_contracts_large", 90, int)
 
 
 def _gov_contract_large_threshold() -> float:
-    cfg = getattr(config, "_policy", {}) or {}
-    return float(((cfg.get("signals") or {}).get("gov_contract_large_threshold_usd", 50_000_000)))
+    return _policy_value("signals", "gov_contract_large_threshold_usd", 50_000_000, float)
 
 
 def _freshness_days_insider() -> int:
     """Insider trades: 10d captures buy clusters (Form 4 has 2-day legal lag + clusters span ~week)."""
-    cfg = getattr(config, "_policy", {}) or {}
-    return int(((cfg.get("signals") or {}).get("freshness_days_insider", 10)))
+    return _policy_value("signals", "freshness_days_insider", 10, int)
 
 
 def _freshness_days_sec13f() -> int:
     """SEC 13F filings arrive in 1-2 days after quarter-end → 6d still captures fresh filings."""
-    cfg = getattr(config, "_policy", {}) or {}
-    return int(((cfg.get("signals") or {}).get("freshness_days_sec13f", 6)))
+    return _policy_value("signals", "freshness_days_sec13f", 6, int)
 
 
 def _freshness_days_congress() -> int:
     """Congress/Senate/House disclosures have up to 45 days legal delay (STOCK Act).
     40 days captures ~95% of valid signals without pulling stale trades."""
-    cfg = getattr(config, "_policy", {}) or {}
-    return int(((cfg.get("signals") or {}).get("freshness_days_congress", 40)))
+    return _policy_value("signals", "freshness_days_congress", 40, int)
 
 
-def _age_days(dt: datetime) -> float:
-    now = datetime.now(timezone.utc)
+def _age_days(dt: datetime, now: datetime) -> float:
     delta = now - dt
     return max(delta.total_seconds() / 86400.0, 0.0)
 
+
 def _parse_dt(value) -> datetime | None:
     if not value:
         return None
+    return _parse_iso(str(value))
+
+
+# Row dates repeat heavily across symbols (daily series), and datetimes are
+# immutable, so parsed values are shared instead of re-parsed per row.
+@functools.lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime | None:
     try:
-        dt = datetime.fromisoformat(str(value).replace("Z", ""))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
-    except Exception:
+        dt = datetime.fromisoformat(value.replace("Z", ""))
+    except ValueError:
         return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _iso_sort_key(item: dict) -> str:
+    """Date string of a row for recency ordering; "" (oldest) when not ISO-like."""
+    value = item.get("Date") or item.get("date")
+    if not value:
+        return ""
+    value = str(value)
+    return value if value[:4].isdigit() else ""
+
+
+# Strips currency formatting ("$1,234.50") in a single pass.
+_AMOUNT_TBL = str.maketrans("", "", "$,")
+
+
+def _parse_amounts(values: list) -> np.ndarray:
+    """Parse a payload column of amounts (numbers or "$1,234" strings); 0.0 when invalid."""
+    cleaned = pd.Series(values, dtype=object).astype(str).str.translate(_AMOUNT_TBL)
+    return pd.to_numeric(cleaned, errors="coerce").fillna(0.0).to_numpy(dtype=float)
+
+
+# Normalised ``Transaction`` values counted as buys by the congress extractors.
+_PURCHASE_TRANSACTIONS = ("purchase", "buy")
 
 
-def _latest_item(items, date_keys: tuple[str, ...]):
-    latest = None
-    latest_dt = None
-    for item in items:
-        dt = None
-        for key in date_keys:
-            dt = _parse_dt(item.get(key))
-            if dt:
-                break
-        if dt and (latest_dt is None or dt > latest_dt):
-            latest = item
-            latest_dt = dt
-    return latest
+# Columnar views of cross-ticker payloads:
+# (id(payload), date_keys, value_keys, numeric_keys, text_keys)
+#     -> (payload, {TICKER: {column: ndarray}}).
+_COLUMNS_CACHE: dict[tuple, tuple[list, dict[str, dict[str, np.ndarray]]]] = {}
+_COLUMNS_CACHE_MAX = 32
+_COLUMNS_LOCK = threading.Lock()
+_EPOCH = pd.Timestamp(0, tz="UTC")
 
 
-def _insider_trade_features(symbol: str, freshness_days: int) -> tuple[dict[str, float | int], list[float]]:
+def _first_parseable_ts(columns: list[list]) -> np.ndarray:
+    """Epoch seconds per row from the first date column that parses there.
+
+    A present but unparseable value ("N/A", a non-ISO string) falls through
+    to the next key instead of leaving the row undated.
+    """
+    ts = np.full(len(columns[0]) if columns else 0, np.nan)
+    for column in columns:
+        missing = np.isnan(ts)
+        if not missing.any():
+            break
+        ts[missing] = _epoch_seconds(column)[missing]
+    return ts
+
+
+def _epoch_seconds(values: list) -> np.ndarray:
+    """Parse ISO dates in one vectorised call; NaN where missing or invalid.
+
+    pandas < 2.0 reads ``format="ISO8601"`` as a literal strftime pattern and
+    coerces every value to NaT without raising, so values pandas left
+    unparsed are retried one by one with :func:`_parse_dt`.
+    """
+    series = pd.Series(values, dtype=object)
+    try:
+        stamps = pd.to_datetime(series, utc=True, errors="coerce", format="ISO8601")
+    except (TypeError, ValueError):
+        stamps = pd.to_datetime(series, utc=True, errors="coerce")
+    seconds = (stamps - _EPOCH).dt.total_seconds().to_numpy(dtype=float, copy=True)
+    for i in np.flatnonzero(np.isnan(seconds)):
+        dt = _parse_dt(values[i])
+        if dt is not None:
+            seconds[i] = dt.timestamp()
+    return seconds
+
+
+def _columns_for(
+    data,
+    symbol: str,
+    date_keys: tuple[str, ...],
+    value_keys: tuple[str, ...] = (),
+    numeric_keys: tuple[str, ...] = (),
+    text_keys: tuple[str, ...] = (),
+) -> dict[str, np.ndarray] | None:
+    """Per-symbol column arrays of a payload, built once per payload.
+
+    ``ts`` holds epoch seconds of the first parseable ``date_keys`` value,
+    ``value_keys`` are raw object arrays, ``numeric_keys`` are parsed with
+    :func:`_parse_amounts` and ``text_keys`` are stripped/lower-cased strings.
+    Returns ``None`` when the symbol has no rows.
+    """
+    memo_key = (id(data), date_keys, value_keys, numeric_keys, text_keys)
+    hit = _COLUMNS_CACHE.get(memo_key)
+    if hit is None or hit[0] is not data:
+        dates: dict[str, list] = {key: [] for key in date_keys}
+        rows = 0
+        values: dict[str, list] = {key: [] for key in value_keys}
+        numbers: dict[str, list] = {key: [] for key in numeric_keys}
+        texts: dict[str, list[str]] = {key: [] for key in text_keys}
+        bounds: dict[str, tuple[int, int]] = {}
+        for sym, items in quiver_ingest.index_by_ticker(data).items():
+            start = rows
+            for item in items:
+                for key in date_keys:
+                    dates[key].append(item.get(key))
+                for key in value_keys:
+                    values[key].append(item.get(key))
+                for key in numeric_keys:
+                    numbers[key].append(item.get(key))
+                for key in text_keys:
+                    texts[key].append(str(item.get(key) or "").strip().lower())
+            rows += len(items)
+            bounds[sym] = (start, rows)
+        columns = {"ts": _first_parseable_ts([dates[key] for key in date_keys])}
+        for key, column in values.items():
+            arr = np.empty(len(column), dtype=object)
+            arr[:] = column
+            columns[key] = arr
+        for key, column in numbers.items():
+            columns[key] = _parse_amounts(column)
+        for key, column in texts.items():
+            columns[key] = np.asarray(column, dtype=str)
+        by_symbol = {
+            sym: {name: arr[a:b] for name, arr in columns.items()}
+            for sym, (a, b) in bounds.items()
+        }
+        with _COLUMNS_LOCK:
+            while len(_COLUMNS_CACHE) >= _COLUMNS_CACHE_MAX:
+                _COLUMNS_CACHE.pop(next(iter(_COLUMNS_CACHE)))
+            _COLUMNS_CACHE[memo_key] = (data, by_symbol)
+        hit = (data, by_symbol)
+    return hit[1].get(symbol.upper())
+
+
+def _drop_columns(data) -> None:
+    """Forget the columnar views of a payload that has been replaced."""
+    with _COLUMNS_LOCK:
+        for memo_key in [k for k, hit in _COLUMNS_CACHE.items() if hit[0] is data]:
+            del _COLUMNS_CACHE[memo_key]
+
+
+quiver_ingest.on_payload_retired(_drop_columns)
+
+
+def _ages_from_ts(ts: np.ndarray, now: datetime) -> np.ndarray:
+    """Vectorised :func:`_age_days`; NaN stays NaN (undated rows)."""
+    return np.maximum((now.timestamp() - ts) / 86400.0, 0.0)
+
+
+def _fresh_rows(ts: np.ndarray, freshness_days, now: datetime) -> tuple[np.ndarray, list[float]]:
+    """Mask of rows within ``freshness_days`` (scalar or per-row) and their ages.
+
+    Undated rows (NaN age) are kept but carry no age, matching the scalar
+    extractors' behaviour.
+    """
+    age = _ages_from_ts(ts, now)
+    keep = ~(age > freshness_days)
+    return keep, age[keep & ~np.isnan(age)].tolist()
+
+
+def _latest_fresh(
+    cols: dict[str, np.ndarray] | None, freshness_days: float, now: datetime
+) -> tuple[int, float] | None:
+    """Index and age of the symbol's most recent dated row, if within ``freshness_days``."""
+    if cols is None:
+        return None
+    ts = cols["ts"]
+    if not ts.size or np.isnan(ts).all():
+        return None
+    idx = int(np.nanargmax(ts))
+    age = max((now.timestamp() - float(ts[idx])) / 86400.0, 0.0)
+    return (idx, age) if age <= freshness_days else None
+
+
+def _insider_trade_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     data = quiver_ingest.fetch_live_insiders()
     buys = 0
     sells = 0
     ages: list[float] = []
-    if isinstance(data, list):
-        for item in data:
-            if item.get("Ticker") != symbol.upper():
-                continue
-            dt = _parse_dt(item.get("Date"))
-            if dt is not None:
-                age = _age_days(dt)
-                if age > freshness_days:
-                    continue
-                ages.append(age)
-            code = item.get("TransactionCode")
-            if code == "P":
-                buys += 1
-            elif code == "S":
-                sells += 1
-    return (
-        {
-            "buy_count": buys,
-            "sell_count": sells,
-        },
-        ages,
-    )
-
-
-def _gov_contract_features(symbol: str, freshness_days: int) -> tuple[dict[str, float | int], list[float]]:
+    cols = _columns_for(data, symbol, ("Date",), ("TransactionCode",)) if isinstance(data, list) else None
+    if cols is not None:
+        keep, ages = _fresh_rows(cols["ts"], freshness_days, now)
+        codes = cols["TransactionCode"][keep]
+        buys = int((codes == "P").sum())
+        sells = int((codes == "S").sum())
+    out["quiver_insider_buy_count"] = buys
+    out["quiver_insider_sell_count"] = sells
+    return ages
+
+
+def _gov_contract_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     # Prefer govcontractsall (individual contracts with exact dates) for precise
     # freshness filtering. Fall back to quarterly govcontracts if unavailable.
     data = quiver_ingest.fetch_live_govcontractsall_cached()
@@ -131,316 +304,388 @@ def _gov_contract_features(symbol: str, freshness_days: int) -> tuple[dict[str,
     total_amount = 0.0
     count = 0
     ages: list[float] = []
-    large_threshold = _gov_contract_large_threshold()
-    freshness_large = _freshness_days_gov_contracts_large()
-    if isinstance(data, list):
-        for item in data:
-            if item.get("Ticker") != symbol.upper():
-                continue
-            try:
-                amt = float(str(item.get("Amount", "0")).replace("$", "").replace(",", ""))
-            except Exception:
-                amt = 0.0
-            # Large contracts (multi-year execution) get a longer freshness window
-            # because their revenue impact is spread over quarters, not yet discounted.
-            effective_freshness = freshness_large if amt >= large_threshold else freshness_days
-            dt = _parse_dt(
-                item.get("Date")
-                or item.get("action_date")
-                or item.get("AnnouncementDate")
-            )
-            if dt is not None:
-                age = _age_days(dt)
-                if age > effective_freshness:
-                    continue
-                ages.append(age)
-            total_amount += amt
-            count += 1
-    return ({"total_amount": total_amount, "count": count}, ages)
+    cols = (
+        _columns_for(data, symbol, ("Date", "action_date", "AnnouncementDate"), numeric_keys=("Amount",))
+        if isinstance(data, list)
+        else None
+    )
+    if cols is not None:
+        amounts = cols["Amount"]
+        # Large contracts (multi-year execution) get a longer freshness window
+        # because their revenue impact is spread over quarters, not yet discounted.
+        effective_freshness = np.where(
+            amounts >= _gov_contract_large_threshold(),
+            _freshness_days_gov_contracts_large(),
+            freshness_days,
+        )
+        keep, ages = _fresh_rows(cols["ts"], effective_freshness, now)
+        total_amount = float(amounts[keep].sum())
+        count = int(keep.sum())
+    out["quiver_gov_contract_total_amount"] = total_amount
+    out["quiver_gov_contract_count"] = count
+    return ages
 
 
-def _patent_momentum_features(symbol: str, freshness_days: int) -> tuple[dict[str, float], list[float]]:
+def _patent_momentum_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     data = quiver_ingest.fetch_live_patentmomentum_cached()
     latest_value = 0.0
     ages: list[float] = []
-    if isinstance(data, list):
-        items = [item for item in data if item.get("ticker") == symbol.upper()]
-        latest = _latest_item(items, ("date", "Date"))
-        if latest and isinstance(latest.get("momentum"), (int, float)):
-            dt = _parse_dt(latest.get("date") or latest.get("Date"))
-            if dt is None:
-                latest_value = float(latest.get("momentum"))
-            else:
-                age = _age_days(dt)
-                if age <= freshness_days:
-                    latest_value = float(latest.get("momentum"))
-                    ages.append(age)
-    return ({"latest_momentum": latest_value}, ages)
-
-
-def _wsb_features(symbol: str, freshness_days: int) -> tuple[dict[str, float], list[float]]:
+    cols = _columns_for(data, symbol, ("date", "Date"), ("momentum",)) if isinstance(data, list) else None
+    hit = _latest_fresh(cols, freshness_days, now)
+    if hit is not None:
+        idx, age = hit
+        momentum = cols["momentum"][idx]
+        if isinstance(momentum, (int, float)):
+            latest_value = float(momentum)
+            ages.append(age)
+    out["quiver_patent_momentum_latest"] = latest_value
+    return ages
+
+
+def _wsb_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     data = quiver_ingest.fetch_historical_wallstreetbets(symbol)
     max_mentions = 0.0
     ages: list[float] = []
     if isinstance(data, list):
-        # Sort descending by date so we always inspect the 5 most recent entries,
-        # regardless of the order the API returns historical records.
-        _epoch = datetime.min.replace(tzinfo=timezone.utc)
-        dated = sorted(
-            data,
-            key=lambda x: _parse_dt(x.get("Date") or x.get("date")) or _epoch,
-            reverse=True,
-        )
-        for item in dated[:5]:
+        # Inspect the 5 most recent entries regardless of the order the API
+        # returns historical records.  ISO date strings order lexicographically,
+        # so only the selected rows are parsed below.
+        for item in heapq.nlargest(5, data, key=_iso_sort_key):
             mentions = item.get("Mentions")
             if isinstance(mentions, (int, float)):
                 dt = _parse_dt(item.get("Date") or item.get("date"))
                 if dt is None:
                     max_mentions = max(max_mentions, float(mentions))
                     continue
-                age = _age_days(dt)
+                age = _age_days(dt, now)
                 if age <= freshness_days:
                     max_mentions = max(max_mentions, float(mentions))
                     ages.append(age)
-    return ({"recent_max_mentions": max_mentions}, ages)
+    out["quiver_wsb_recent_max_mentions"] = max_mentions
+    return ages
 
 
-def _sec13f_features(symbol: str, freshness_days: int) -> tuple[dict[str, float], list[float]]:
+def _sec13f_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     data = quiver_ingest.fetch_live_sec13f_cached()
     count = 0
     ages: list[float] = []
-    if isinstance(data, list):
-        for item in data:
-            if item.get("Ticker") != symbol.upper():
-                continue
-            dt = _parse_dt(item.get("ReportDate") or item.get("Date"))
-            if dt is not None:
-                age = _age_days(dt)
-                if age > freshness_days:
-                    continue
-                ages.append(age)
-            count += 1
-    return ({"count": float(count)}, ages)
+    cols = _columns_for(data, symbol, ("ReportDate", "Date")) if isinstance(data, list) else None
+    if cols is not None:
+        keep, ages = _fresh_rows(cols["ts"], freshness_days, now)
+        count = int(keep.sum())
+    out["quiver_sec13f_count"] = float(count)
+    return ages
 
 
-def _sec13f_change_features(symbol: str, freshness_days: int) -> tuple[dict[str, float], list[float]]:
+def _sec13f_change_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     data = quiver_ingest.fetch_live_sec13fchanges_cached()
     latest_change = 0.0
     ages: list[float] = []
-    if isinstance(data, list):
-        items = [item for item in data if item.get("Ticker") == symbol.upper()]
-        latest = _latest_item(items, ("ReportDate", "Date"))
-        if latest and isinstance(latest.get("Change_Pct"), (int, float)):
-            dt = _parse_dt(latest.get("ReportDate") or latest.get("Date"))
-            if dt is None:
-                latest_change = float(latest.get("Change_Pct"))
-            else:
-                age = _age_days(dt)
-                if age <= freshness_days:
-                    latest_change = float(latest.get("Change_Pct"))
-                    ages.append(age)
-    return ({"latest_change_pct": latest_change}, ages)
-
-
-def _house_purchase_features(symbol: str, freshness_days: int = 0) -> tuple[dict[str, float], list[float]]:
+    cols = _columns_for(data, symbol, ("ReportDate", "Date"), ("Change_Pct",)) if isinstance(data, list) else None
+    hit = _latest_fresh(cols, freshness_days, now)
+    if hit is not None:
+        idx, age = hit
+        change = cols["Change_Pct"][idx]
+        if isinstance(change, (int, float)):
+            latest_change = float(change)
+            ages.append(age)
+    out["quiver_sec13f_change_latest_pct"] = latest_change
+    return ages
+
+
+def _house_purchase_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     freshness_days = freshness_days or _freshness_days_congress()
     data = quiver_ingest.fetch_live_housetrading()
     count = 0
     ages: list[float] = []
-    if isinstance(data, list):
-        for item in data:
-            if item.get("Ticker") != symbol.upper():
-                continue
-            if (item.get("Transaction") or "").strip().lower() != "purchase":
-                continue
-            # ReportDate = when disclosure became public (STOCK Act); use for freshness.
-            # Fallback to Date (transaction date) if ReportDate absent.
-            dt = _parse_dt(item.get("ReportDate") or item.get("Date"))
-            if dt is not None:
-                age = _age_days(dt)
-                if age > freshness_days:
-                    continue
-                ages.append(age)
-            count += 1
-    return ({"count": float(count)}, ages)
-
-
-def _offexchange_features(symbol: str) -> tuple[dict[str, float], list[float]]:
-    """Return off-exchange short ratio (DPI).  High DPI = high short pressure = bearish."""
+    # ReportDate = when disclosure became public (STOCK Act); use for freshness.
+    # Fallback to Date (transaction date) if ReportDate absent.
+    cols = (
+        _columns_for(data, symbol, ("ReportDate", "Date"), text_keys=("Transaction",))
+        if isinstance(data, list)
+        else None
+    )
+    if cols is not None:
+        purchases = cols["Transaction"] == "purchase"
+        keep, ages = _fresh_rows(cols["ts"][purchases], freshness_days, now)
+        count = int(keep.sum())
+    out["quiver_house_purchase_count"] = float(count)
+    return ages
+
+
+def _offexchange_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
+    """Off-exchange short ratio (DPI).  High DPI = high short pressure = bearish.
+
+    Off-exchange data is published daily, so a fixed 5-day window applies and
+    ``freshness_days`` is ignored.
+    """
     data = quiver_ingest.fetch_live_offexchange_cached()
     latest_dpi = 0.0
     ages: list[float] = []
-    if isinstance(data, list):
-        items = [item for item in data if item.get("Ticker") == symbol.upper()]
-        latest = _latest_item(items, ("Date", "date"))
-        if latest and isinstance(latest.get("DPI"), (int, float)):
-            dt = _parse_dt(latest.get("Date") or latest.get("date"))
-            if dt is None:
-                latest_dpi = float(latest.get("DPI"))
-            else:
-                age = _age_days(dt)
-                if age <= 5:  # off-exchange data is published daily; 5 days is fresh
-                    latest_dpi = float(latest.get("DPI"))
-                    ages.append(age)
-    return ({"latest_dpi": latest_dpi}, ages)
-
-
-def _senate_purchase_features(symbol: str, freshness_days: int = 0) -> tuple[dict[str, float], list[float]]:
+    cols = _columns_for(data, symbol, ("Date", "date"), ("DPI",)) if isinstance(data, list) else None
+    hit = _latest_fresh(cols, 5, now)  # off-exchange data is published daily; 5 days is fresh
+    if hit is not None:
+        idx, age = hit
+        dpi = cols["DPI"][idx]
+        if isinstance(dpi, (int, float)):
+            latest_dpi = float(dpi)
+            ages.append(age)
+    out["quiver_offexchange_dpi"] = latest_dpi
+    return ages
+
+
+def _senate_purchase_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     freshness_days = freshness_days or _freshness_days_congress()
     data = quiver_ingest.fetch_live_senatetrading_cached()
     count = 0
     ages: list[float] = []
-    if isinstance(data, list):
-        for item in data:
-            if item.get("Ticker") != symbol.upper():
-                continue
-            transaction = (item.get("Transaction") or "").strip().lower()
-            if transaction not in ("purchase", "buy"):
-                continue
-            # ReportDate = when disclosure became public (STOCK Act); use for freshness.
-            # Fallback to Date/TransactionDate if ReportDate absent.
-            dt = _parse_dt(item.get("ReportDate") or item.get("Date") or item.get("TransactionDate"))
-            if dt is not None:
-                age = _age_days(dt)
-                if age > freshness_days:
-                    continue
-                ages.append(age)
-            count += 1
-    return ({"count": float(count)}, ages)
+    # ReportDate = when disclosure became public (STOCK Act); use for freshness.
+    # Fallback to Date/TransactionDate if ReportDate absent.
+    cols = (
+        _columns_for(data, symbol, ("ReportDate", "Date", "TransactionDate"), text_keys=("Transaction",))
+        if isinstance(data, list)
+        else None
+    )
+    if cols is not None:
+        purchases = np.isin(cols["Transaction"], _PURCHASE_TRANSACTIONS)
+        keep, ages = _fresh_rows(cols["ts"][purchases], freshness_days, now)
+        count = int(keep.sum())
+    out["quiver_senate_purchase_count"] = float(count)
+    return ages
 
 
-def _congress_purchase_features(symbol: str, freshness_days: int = 0) -> tuple[dict[str, float], list[float]]:
+def _congress_purchase_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     """Congress live endpoint: filter freshness by ReportDate (STOCK Act disclosure date),
     not TransactionDate (when the trade occurred)."""
     freshness_days = freshness_days or _freshness_days_congress()
     data = quiver_ingest.fetch_live_congresstrading_cached()
     count = 0
     ages: list[float] = []
-    if isinstance(data, list):
-        for item in data:
-            if item.get("Ticker") != symbol.upper():
-                continue
-            transaction = (item.get("Transaction") or "").strip().lower()
-            if transaction not in ("purchase", "buy"):
-                continue
-            # ReportDate = when disclosure became public (STOCK Act); use for freshness.
-            # Fallback to TransactionDate/Date if ReportDate absent.
-            dt = _parse_dt(item.get("ReportDate") or item.get("TransactionDate") or item.get("Date"))
-            if dt is not None:
-                age = _age_days(dt)
-                if age > freshness_days:
-                    continue
-                ages.append(age)
-            count += 1
-    return ({"count": float(count)}, ages)
+    # ReportDate = when disclosure became public (STOCK Act); use for freshness.
+    # Fallback to TransactionDate/Date if ReportDate absent.
+    cols = (
+        _columns_for(data, symbol, ("ReportDate", "TransactionDate", "Date"), text_keys=("Transaction",))
+        if isinstance(data, list)
+        else None
+    )
+    if cols is not None:
+        purchases = np.isin(cols["Transaction"], _PURCHASE_TRANSACTIONS)
+        keep, ages = _fresh_rows(cols["ts"][purchases], freshness_days, now)
+        count = int(keep.sum())
+    out["quiver_congress_purchase_count"] = float(count)
+    return ages
 
 
-def _twitter_features(symbol: str, freshness_days: int) -> tuple[dict[str, float], list[float]]:
+def _twitter_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     data = quiver_ingest.fetch_live_twitter()
     latest_followers = 0.0
     ages: list[float] = []
-    if isinstance(data, list):
-        items = [item for item in data if item.get("Ticker") == symbol.upper()]
-        latest = _latest_item(items, ("Date", "date"))
-        if latest:
-            followers = latest.get("Followers")
-            dt = _parse_dt(latest.get("Date") or latest.get("date"))
-            if dt is None or _age_days(dt) <= freshness_days:
-                if isinstance(followers, (int, float)):
-                    latest_followers = float(followers)
-                if dt is not None:
-                    ages.append(_age_days(dt))
-    return ({"latest_followers": latest_followers}, ages)
-
-
-def _app_ratings_features(symbol: str, freshness_days: int) -> tuple[dict[str, float], list[float]]:
+    cols = _columns_for(data, symbol, ("Date", "date"), ("Followers",)) if isinstance(data, list) else None
+    hit = _latest_fresh(cols, freshness_days, now)
+    if hit is not None:
+        idx, age = hit
+        followers = cols["Followers"][idx]
+        if isinstance(followers, (int, float)):
+            latest_followers = float(followers)
+        ages.append(age)
+    out["quiver_twitter_latest_followers"] = latest_followers
+    return ages
+
+
+def _app_ratings_features(
+    symbol: str, freshness_days: int, out: dict[str, float | int], now: datetime
+) -> list[float]:
     data = quiver_ingest.fetch_live_appratings_cached()
     latest_rating = 0.0
     latest_count = 0.0
     ages: list[float] = []
-    if isinstance(data, list):
-        items = [item for item in data if item.get("Ticker") == symbol.upper()]
-        latest = _latest_item(items, ("Date", "date"))
-        if latest:
-            rating = latest.get("Rating")
-            count = latest.get("Count")
-            dt = _parse_dt(latest.get("Date") or latest.get("date"))
-            if dt is None or _age_days(dt) <= freshness_days:
-                if isinstance(rating, (int, float)):
-                    latest_rating = float(rating)
-                if isinstance(count, (int, float)):
-                    latest_count = float(count)
-                if dt is not None:
-                    ages.append(_age_days(dt))
-    return ({"latest_rating": latest_rating, "latest_count": latest_count}, ages)
+    cols = _columns_for(data, symbol, ("Date", "date"), ("Rating", "Count")) if isinstance(data, list) else None
+    hit = _latest_fresh(cols, freshness_days, now)
+    if hit is not None:
+        idx, age = hit
+        rating = cols["Rating"][idx]
+        count = cols["Count"][idx]
+        if isinstance(rating, (int, float)):
+            latest_rating = float(rating)
+        if isinstance(count, (int, float)):
+            latest_count = float(count)
+        ages.append(age)
+    out["quiver_app_rating_latest"] = latest_rating
+    out["quiver_app_rating_latest_count"] = latest_count
+    return ages
+
+
+# (extractor, policy freshness getter, heavy endpoints read) in output-key
+# order.  Each extractor reads its endpoint's indexed rows for the symbol once
+# and writes its features straight into the shared output dict.  ``None``
+# marks the per-symbol WSB history; the quarterly govcontracts fallback is
+# left out because it is only read when govcontractsall comes back empty.
+_EXTRACTORS = (
+    (_insider_trade_features, _freshness_days_insider, ("live_insiders",)),
+    (_gov_contract_features, _freshness_days_gov_contracts, ("live_govcontractsall",)),
+    (_patent_momentum_features, _freshness_days, ("live_patentmomentum",)),
+    (_wsb_features, _freshness_days, None),
+    (_sec13f_features, _freshness_days_sec13f, ("live_sec13f",)),
+    (_sec13f_change_features, _freshness_days_sec13f, ("live_sec13fchanges",)),
+    (_house_purchase_features, _freshness_days_congress, ("live_housetrading",)),
+    (_senate_purchase_features, _freshness_days_congress, ("live_senatetrading",)),
+    (_congress_purchase_features, _freshness_days_congress, ("live_congresstrading",)),
+    (_offexchange_features, _freshness_days, ("live_offexchange",)),
+    (_app_ratings_features, _freshness_days, ("live_appratings",)),
+    (_twitter_features, _freshness_days, ("live_twitter",)),
+)
+
+
+_EXTRACTOR_POOL: ThreadPoolExecutor | None = None
+_EXTRACTOR_POOL_LOCK = threading.Lock()
+_EXTRACTOR_WORKERS = 8
+
+
+def _extractor_pool() -> ThreadPoolExecutor:
+    global _EXTRACTOR_POOL
+    with _EXTRACTOR_POOL_LOCK:
+        if _EXTRACTOR_POOL is None:
+            _EXTRACTOR_POOL = ThreadPoolExecutor(
+                max_workers=_EXTRACTOR_WORKERS, thread_name_prefix="quiver-features"
+            )
+        return _EXTRACTOR_POOL
+
+
+def _run_extractor(extractor, freshness_days: int, symbols: list[str], now: datetime):
+    """Run one extractor over ``symbols``; return their outputs and youngest ages."""
+    outs: dict[str, dict[str, float | int]] = {}
+    min_ages: dict[str, float | None] = {}
+    for sym in symbols:
+        out: dict[str, float | int] = {}
+        min_ages[sym] = min(extractor(sym, freshness_days, out, now), default=None)
+        outs[sym] = out
+    return outs, min_ages
+
+
+def _extractor_warm(endpoints: tuple[str, ...] | None, symbols: list[str]) -> bool:
+    """True when the extractor's payloads are answered without a download."""
+    if endpoints is None:
+        return all(quiver_ingest.wallstreetbets_cached(sym) for sym in symbols)
+    return all(quiver_ingest.heavy_endpoint_cached(name) for name in endpoints)
 
 
 def get_quiver_features(symbol: str) -> dict[str, float | int]:
     """Return numeric Quiver features without scoring or thresholds."""
-    freshness_days = _freshness_days()
-    freshness_days_insider = _freshness_days_insider()
-    freshness_days_sec13f = _freshness_days_sec13f()
-    freshness_days_congress = _freshness_days_congress()
-    freshness_days_gov = _freshness_days_gov_contracts()
-    ages: list[float] = []
-    insider, insider_ages = _insider_trade_features(symbol, freshness_days_insider)
-    gov, gov_ages = _gov_contract_features(symbol, freshness_days_gov)
-    patent, patent_ages = _patent_momentum_features(symbol, freshness_days)
-    wsb, wsb_ages = _wsb_features(symbol, freshness_days)
-    sec13f, sec13f_ages = _sec13f_features(symbol, freshness_days_sec13f)
-    sec13f_changes, sec13f_change_ages = _sec13f_change_features(symbol, freshness_days_sec13f)
-    house, house_ages = _house_purchase_features(symbol, freshness_days_congress)
-    senate, senate_ages = _senate_purchase_features(symbol, freshness_days_congress)
-    congress, congress_ages = _congress_purchase_features(symbol, freshness_days_congress)
-    offexchange, offexchange_ages = _offexchange_features(symbol)
-    app_ratings, app_ratings_ages = _app_ratings_features(symbol, freshness_days)
-    twitter, twitter_ages = _twitter_features(symbol, freshness_days)
-    ages.extend(
-        insider_ages
-        + gov_ages
-        + patent_ages
-        + wsb_ages
-        + sec13f_ages
-        + sec13f_change_ages
-        + house_ages
-        + senate_ages
-        + congress_ages
-        + offexchange_ages
-        + app_ratings_ages
-        + twitter_ages
-    )
-    age_min = min(ages) if ages else 0.0
-
-    return {
-        "quiver_insider_buy_count": insider["buy_count"],
-        "quiver_insider_sell_count": insider["sell_count"],
-        "quiver_gov_contract_total_amount": gov["total_amount"],
-        "quiver_gov_contract_count": gov["count"],
-        "quiver_patent_momentum_latest": patent["latest_momentum"],
-        "quiver_wsb_recent_max_mentions": wsb["recent_max_mentions"],
-        "quiver_sec13f_count": sec13f["count"],
-        "quiver_sec13f_change_latest_pct": sec13f_changes["latest_change_pct"],
-        "quiver_house_purchase_count": house["count"],
-        "quiver_senate_purchase_count": senate["count"],
-        "quiver_congress_purchase_count": congress["count"],
-        "quiver_offexchange_dpi": offexchange["latest_dpi"],
-        "quiver_app_rating_latest": app_ratings["latest_rating"],
-        "quiver_app_rating_latest_count": app_ratings["latest_count"],
-        "quiver_twitter_latest_followers": twitter["latest_followers"],
-        "quiver_signal_age_days_min": age_min,
+    return get_quiver_features_batch([symbol])[symbol]
+
+
+def get_quiver_features_batch(symbols: Iterable[str]) -> dict[str, dict[str, float | int]]:
+    """Features for several symbols, one endpoint at a time.
+
+    Each extractor's payload, columnar view and freshness policy are resolved
+    once and then reused for every symbol, instead of once per symbol.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    features: dict[str, dict[str, float | int]] = {sym: {} for sym in symbols}
+    age_min: dict[str, float | None] = dict.fromkeys(symbols)
+    # One clock read per batch: every extractor measures ages against it.
+    now = datetime.now(timezone.utc)
+    # Extractors read distinct endpoints, so cold ones download in parallel
+    # on the pool (single-flight and the shared token bucket still apply).
+    # Warm ones are pure CPU over cached payloads and run inline meanwhile,
+    # which on a warm cache skips the pool hand-off entirely.
+    jobs = {
+        i: _extractor_pool().submit(_run_extractor, extractor, freshness(), symbols, now)
+        for i, (extractor, freshness, endpoints) in enumerate(_EXTRACTORS)
+        if not _extractor_warm(endpoints, symbols)
     }
+    # Merge in _EXTRACTORS order so the output keys keep a stable order.
+    for i, (extractor, freshness, _) in enumerate(_EXTRACTORS):
+        if i in jobs:
+            outs, job_min_ages = jobs[i].result()
+        else:
+            outs, job_min_ages = _run_extractor(extractor, freshness(), symbols, now)
+        for sym in symbols:
+            features[sym].update(outs[sym])
+            age = job_min_ages[sym]
+            if age is not None and (age_min[sym] is None or age < age_min[sym]):
+                age_min[sym] = age
+    for sym in symbols:
+        age = age_min[sym]
+        features[sym]["quiver_signal_age_days_min"] = age if age is not None else 0.0
+    return features
 
 
 def _has_quiver_signal(features: dict[str, float | int]) -> bool:
-    for key, value in features.items():
-        if key == "quiver_signal_age_days_min":
-            continue
-        try:
-            if float(value) != 0.0:
-                return True
-        except Exception:
-            continue
-    return False
+    # Snapshots are all-numeric (see QUIVER_FEATURE_KEYS): truthiness is != 0.
+    return any(value for key, value in features.items() if key != "quiver_signal_age_days_min")
+
+
+def _features_key(symbol: str) -> str:
+    return quiver_ingest.CACHE_KEYS["symbol_features"].format(symbol=symbol.upper())
+
+
+# Output schema of get_quiver_features.  Cached snapshots store only the values,
+# in this order, and are turned back into a dict when handed to callers.
+QUIVER_FEATURE_KEYS = (
+    "quiver_insider_buy_count",
+    "quiver_insider_sell_count",
+    "quiver_gov_contract_total_amount",
+    "quiver_gov_contract_count",
+    "quiver_patent_momentum_latest",
+    "quiver_wsb_recent_max_mentions",
+    "quiver_sec13f_count",
+    "quiver_sec13f_change_latest_pct",
+    "quiver_house_purchase_count",
+    "quiver_senate_purchase_count",
+    "quiver_congress_purchase_count",
+    "quiver_offexchange_dpi",
+    "quiver_app_rating_latest",
+    "quiver_app_rating_latest_count",
+    "quiver_twitter_latest_followers",
+    "quiver_signal_age_days_min",
+)
+
+
+def _pack_features(features: dict[str, float | int]) -> list[float | int]:
+    return [features.get(key, 0.0) for key in QUIVER_FEATURE_KEYS]
+
+
+def _unpack_features(packed) -> dict[str, float | int] | None:
+    """Dict view of a cached snapshot; ``None`` if it predates the current schema."""
+    if isinstance(packed, dict):
+        return dict(packed)
+    if isinstance(packed, (list, tuple)) and len(packed) == len(QUIVER_FEATURE_KEYS):
+        return dict(zip(QUIVER_FEATURE_KEYS, packed))
+    return None
+
+
+def _cached_features(key: str, ttl: int) -> dict[str, float | int] | None:
+    packed = cache_get(key, ttl)
+    if packed is None:
+        packed = persist_get(key, ttl)
+        if packed is not None:
+            cache_set(key, packed)
+    return _unpack_features(packed) if packed is not None else None
+
+
+def _store_features(key: str, features: dict[str, float | int]) -> None:
+    packed = _pack_features(features)
+    cache_set(key, packed)
+    persist_set(key, packed)
 
 
 def fetch_quiver_signals(symbol: str, fallback_symbol: str | None = None) -> dict[str, float | int]:
@@ -448,31 +693,80 @@ def fetch_quiver_signals(symbol: str, fallback_symbol: str | None = None) -> dic
     if not config.ENABLE_QUIVER:
         return {}
     ttl = _ttl_symbol()
-    k = f"Q_SIG:{symbol.upper()}"
-    v = cache_get(k, ttl)
+    k = _features_key(symbol)
+    v = _cached_features(k, ttl)
     if v is not None:
         return v
-    v = persist_get(k, ttl)
-    if v is not None:
-        cache_set(k, v)
-        return v
     res = get_quiver_features(symbol)
     if fallback_symbol and fallback_symbol.upper() != symbol.upper() and not _has_quiver_signal(res):
-        fallback_key = f"Q_SIG:{fallback_symbol.upper()}"
-        fallback_cached = cache_get(fallback_key, ttl) or persist_get(fallback_key, ttl)
+        fallback_key = _features_key(fallback_symbol)
+        fallback_cached = _cached_features(fallback_key, ttl)
         if fallback_cached is not None:
             res = fallback_cached
         else:
             fallback_res = get_quiver_features(fallback_symbol)
             if _has_quiver_signal(fallback_res):
                 res = fallback_res
-            cache_set(fallback_key, fallback_res)
-            persist_set(fallback_key, fallback_res)
-    cache_set(k, res)
-    persist_set(k, res)
+            _store_features(fallback_key, fallback_res)
+    _store_features(k, res)
     return res
 
 
+def fetch_quiver_signals_batch(
+    symbols: Iterable[str],
+    fallbacks: Mapping[str, str] | None = None,
+) -> dict[str, dict[str, float | int]]:
+    """Cached feature snapshots for several symbols.
+
+    Cache misses are computed together by :func:`get_quiver_features_batch`,
+    so each endpoint payload is resolved once for the whole batch.
+    ``fallbacks`` maps a symbol to the ticker tried when its own features
+    carry no signal, as ``fallback_symbol`` does in :func:`fetch_quiver_signals`,
+    so both paths cache the same snapshot.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if not config.ENABLE_QUIVER:
+        return {sym: {} for sym in symbols}
+    ttl = _ttl_symbol()
+    result: dict[str, dict[str, float | int]] = {}
+    missing: list[str] = []
+    for sym in symbols:
+        cached = _cached_features(_features_key(sym), ttl)
+        if cached is None:
+            missing.append(sym)
+        else:
+            result[sym] = cached
+    if not missing:
+        return result
+    computed = get_quiver_features_batch(missing)
+    retry: dict[str, str] = {}
+    for sym in missing:
+        fallback = (fallbacks or {}).get(sym)
+        if fallback and fallback.upper() != sym.upper() and not _has_quiver_signal(computed[sym]):
+            retry[sym] = fallback
+    cached_fallbacks: dict[str, dict[str, float | int]] = {}
+    cold_fallbacks: list[str] = []
+    for fallback in dict.fromkeys(retry.values()):
+        cached = _cached_features(_features_key(fallback), ttl)
+        if cached is None:
+            cold_fallbacks.append(fallback)
+        else:
+            cached_fallbacks[fallback] = cached
+    fresh_fallbacks = get_quiver_features_batch(cold_fallbacks) if cold_fallbacks else {}
+    for fallback, features in fresh_fallbacks.items():
+        _store_features(_features_key(fallback), features)
+    for sym in missing:
+        features = computed[sym]
+        fallback = retry.get(sym)
+        if fallback in cached_fallbacks:
+            features = cached_fallbacks[fallback]
+        elif fallback in fresh_fallbacks and _has_quiver_signal(fresh_fallbacks[fallback]):
+            features = fresh_fallbacks[fallback]
+        _store_features(_features_key(sym), features)
+        result[sym] = features
+    return {sym: result[sym] for sym in symbols}
+
+
 def get_all_quiver_signals(symbol: str) -> dict[str, float | int]:
     """Return Quiver features for compatibility with legacy callers."""
     return fetch_quiver_signals(symbol)
@@ -485,12 +779,13 @@ def is_approved_by_quiver(symbol: str) -> dict:
 
 def evaluate_quiver_signals(signals, symbol: str = ""):
     """Log Quiver feature snapshots for debugging."""
-    print(f"\n🧪 Evaluando señales Quiver para {symbol}...")
-    for key, value in (signals or {}).items():
-        print(f"   • {key}: {value}")
+    if logger.isEnabledFor(logging.DEBUG):
+        lines = [f"🧪 Evaluando señales Quiver para {symbol}..."]
+        lines.extend(f"   • {key}: {value}" for key, value in (signals or {}).items())
+        logger.debug("\n".join(lines))
     return {"features": signals or {}}
 
 
-def initialize_quiver_caches():
+def initialize_quiver_caches() -> dict[str, bool]:
     """Inicializa los datos pesados de Quiver para ser usados localmente."""
-    quiver_ingest.initialize_quiver_caches()
+    return quiver_ingest.initialize_quiver_caches()
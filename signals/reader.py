@@ -363,6 +363,35 @@ def _yahoo_gate_reasons(
     return reasons
 
 
+def _yahoo_liquidity_floor_reasons(
+    snapshot_data: tuple,
+    strict_thresholds: dict,
+    gate_cfg: dict,
+    quiver_gate_cfg: dict,
+) -> list[str]:
+    """Yahoo reasons that reject a symbol on both the strict and the fast-lane path.
+
+    Uses the loosest threshold either path could apply, so a non-empty result
+    means the symbol fails whatever its Quiver features turn out to be.
+    """
+    min_market_cap = strict_thresholds["min_market_cap"]
+    min_avg_volume = strict_thresholds["min_avg_volume_7d"]
+    max_atr_pct = strict_thresholds["max_atr_pct"]
+    require_trend = strict_thresholds["require_trend_positive"]
+    if bool(quiver_gate_cfg.get("fast_lane_enabled", True)):
+        min_market_cap = min(min_market_cap, float(gate_cfg.get("relaxed_min_market_cap", 300_000_000)))
+        min_avg_volume = min(min_avg_volume, float(gate_cfg.get("relaxed_min_avg_volume_7d", 50_000)))
+        max_atr_pct = max(max_atr_pct, float(gate_cfg.get("relaxed_max_atr_pct", 12.0)))
+        require_trend = require_trend and bool(quiver_gate_cfg.get("fast_lane_require_trend_positive", True))
+    return _yahoo_gate_reasons(
+        snapshot_data=snapshot_data,
+        min_market_cap=min_market_cap,
+        min_avg_volume=min_avg_volume,
+        max_atr_pct=max_atr_pct,
+        require_trend=require_trend,
+    )
+
+
 def _quiver_fast_lane_summary(features: dict[str, float], cfg: dict) -> tuple[bool, list[str], dict]:
     insider_min = float(cfg.get("insider_buy_strong_min_count_7d", 2))
     gov_min = float(cfg.get("gov_contract_strong_min_total_30d", 1_000_000))
@@ -467,6 +496,25 @@ def _load_universe(path: str = "data/symbols.csv") -> List[dict]:
     return universe
 
 
+def _prefetch_quiver_features(symbols: list[tuple[str, str | None]]) -> None:
+    """Fill the Quiver feature cache for ``(quiver_symbol, fallback)`` pairs.
+
+    A failure is only logged: get_symbol_features then fetches each symbol on
+    its own and reports errors per symbol.
+    """
+    if not config.ENABLE_QUIVER or not symbols:
+        return
+    from signals import quiver_utils
+
+    try:
+        quiver_utils.fetch_quiver_signals_batch(
+            [sym for sym, _ in symbols],
+            fallbacks={sym: fallback for sym, fallback in symbols if fallback},
+        )
+    except Exception as exc:
+        log_event(f"SCAN quiver batch prefetch failed err={exc}", event="SCAN")
+
+
 def get_top_signals(
     *,
     max_symbols: int | None = None,
@@ -529,6 +577,10 @@ def get_top_signals(
 
     quiver_gate_disabled = _quiver_gate_disabled(quiver_gate_cfg)
 
+    # Symbols that cleared the Yahoo prefilters, with the per-symbol state the
+    # Quiver and scoring pass below needs.
+    prefiltered: list[tuple] = []
+
     for entry in universe:
         symbol = entry["ticker_map"]["canonical"]
         if symbol in _seen_this_cycle:
@@ -543,6 +595,7 @@ def get_top_signals(
 
         yahoo_symbol = entry["ticker_map"]["yahoo"]
         quiver_symbol = entry["ticker_map"]["quiver"]
+        quiver_fallback_symbol = yahoo_symbol if quiver_symbol != yahoo_symbol else None
         provider_fallback_used = False
 
         yahoo_snapshot, yahoo_hist, yahoo_meta = _fetch_yahoo_snapshot(symbol, yahoo_symbol)
@@ -635,6 +688,62 @@ def get_top_signals(
             )
             continue
 
+        # Below even the fast-lane liquidity floor the symbol is rejected
+        # whatever Quiver says, so its Quiver features are not fetched.
+        floor_reasons = _yahoo_liquidity_floor_reasons(
+            yahoo_snapshot, strict_thresholds, gate_cfg, quiver_gate_cfg
+        )
+        if floor_reasons:
+            decision_trace["yahoo_prefilter_reasons"] = floor_reasons
+            decision_trace["quiver_fetch_status"] = "skipped"
+            # The fast-lane bookkeeping below never runs for this symbol, so
+            # drop a pending first sighting here; otherwise a later scan could
+            # confirm it without two consecutive strong observations.
+            if _fast_lane_pending.pop(symbol, None) is not None:
+                decision_trace["fast_lane_confirm_status"] = "cleared_prefilter"
+            rejected.append(f"{symbol}:yahoo_prefilter")
+            rejection_counts["yahoo_prefilter"] += 1
+            log_event(
+                f"TRACE {symbol} {json.dumps(decision_trace, separators=(',', ':'))}",
+                event="TRACE",
+            )
+            continue
+
+        prefiltered.append(
+            (
+                symbol,
+                yahoo_symbol,
+                quiver_symbol,
+                quiver_fallback_symbol,
+                provider_fallback_used,
+                yahoo_snapshot,
+                yahoo_hist,
+                yahoo_meta,
+                gate_cfg,
+                strict_thresholds,
+                decision_trace,
+            )
+        )
+
+    # One batch for every surviving symbol: each Quiver endpoint payload is
+    # walked once per scan, and get_symbol_features then reads the cache.
+    _prefetch_quiver_features(
+        [(quiver or sym, fallback) for sym, _, quiver, fallback, *_ in prefiltered]
+    )
+
+    for (
+        symbol,
+        yahoo_symbol,
+        quiver_symbol,
+        quiver_fallback_symbol,
+        provider_fallback_used,
+        yahoo_snapshot,
+        yahoo_hist,
+        yahoo_meta,
+        gate_cfg,
+        strict_thresholds,
+        decision_trace,
+    ) in prefiltered:
         quiver_status = "disabled"
         if config.ENABLE_QUIVER:
             quiver_status = "ok"
@@ -646,7 +755,7 @@ def get_top_signals(
                 yahoo_snapshot=yahoo_snapshot,
                 yahoo_symbol=yahoo_symbol,
                 quiver_symbol=quiver_symbol,
-                quiver_fallback_symbol=yahoo_symbol if quiver_symbol != yahoo_symbol else None,
+                quiver_fallback_symbol=quiver_fallback_symbol,
                 yahoo_hist=yahoo_hist,
             )
             decision_trace["quiver_fetch_status"] = quiver_status
@@ -0,0 +1,107 @@
+"""Tests for the SQLite-backed utils.persistent_cache.
+
+Covers:
+  - Round-trip through SQLite across a simulated restart
+  - TTL expiry (memory and on-disk row)
+  - Recovery after a database error (no permanent disable)
+  - Payloads that cannot be encoded kept in memory only
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sqlite3
+import time
+from unittest.mock import MagicMock, patch
+
+from utils import persistent_cache
+
+
+@contextlib.contextmanager
+def _fresh_cache(tmp_path):
+    path = str(tmp_path / "cache" / "quiver_cache.sqlite")
+    persistent_cache._CACHE.clear()
+    persistent_cache._CONN = None
+    try:
+        with patch.object(persistent_cache, "_CACHE_PATH", path):
+            yield path
+    finally:
+        if persistent_cache._CONN is not None:
+            persistent_cache._CONN.close()
+        persistent_cache._CONN = None
+        persistent_cache._CACHE.clear()
+
+
+def _restart() -> None:
+    """Forget memory and the connection, as a new process would."""
+    persistent_cache._CACHE.clear()
+    persistent_cache._CONN.close()
+    persistent_cache._CONN = None
+
+
+def _rows(path: str) -> list[str]:
+    with contextlib.closing(sqlite3.connect(path)) as conn:
+        return [row[0] for row in conn.execute("SELECT key FROM cache")]
+
+
+class TestPersistentCache:
+    def test_round_trip_survives_restart(self, tmp_path):
+        payload = [{"Ticker": "AAPL", "Amount": 1.5}]
+        with _fresh_cache(tmp_path):
+            persistent_cache.set("quiver:live_insiders:2024-01-02", payload)
+            _restart()
+            assert persistent_cache.get("quiver:live_insiders:2024-01-02", ttl=60) == payload
+
+    def test_missing_key_returns_none(self, tmp_path):
+        with _fresh_cache(tmp_path):
+            assert persistent_cache.get("absent", ttl=60) is None
+
+    def test_expired_entry_deleted(self, tmp_path):
+        with _fresh_cache(tmp_path) as path:
+            persistent_cache.set("k", [1])
+            later = time.time() + 120
+            with patch("utils.persistent_cache.time.time", return_value=later):
+                assert persistent_cache.get("k", ttl=60) is None
+            assert "k" not in persistent_cache._CACHE
+            assert _rows(path) == []
+
+    def test_expired_on_disk_after_restart(self, tmp_path):
+        with _fresh_cache(tmp_path):
+            persistent_cache.set("k", [1])
+            _restart()
+            with patch("utils.persistent_cache.time.time", return_value=time.time() + 120):
+                assert persistent_cache.get("k", ttl=60) is None
+
+    def test_error_is_retried_on_next_call(self, tmp_path):
+        with _fresh_cache(tmp_path) as path:
+            persistent_cache.set("a", [1])
+            broken = MagicMock()
+            broken.execute.side_effect = sqlite3.OperationalError("disk I/O error")
+            persistent_cache._CONN = broken
+
+            # The failing write keeps the value in memory and drops the connection.
+            persistent_cache.set("b", [2])
+            assert persistent_cache.get("b") == [2]
+            assert persistent_cache._CONN is None
+            assert persistent_cache._PERSIST_ENABLED is True
+
+            # The next write reconnects and reaches disk.
+            persistent_cache.set("c", [3])
+            assert sorted(_rows(path)) == ["a", "c"]
+
+    def test_unencodable_payload_kept_in_memory(self, tmp_path):
+        payload = [object()]
+        with _fresh_cache(tmp_path) as path:
+            persistent_cache.set("a", [1])
+            persistent_cache.set("k", payload)
+            assert persistent_cache.get("k", ttl=60) is payload
+            assert _rows(path) == ["a"]
+            assert persistent_cache._CONN is not None
+
+    def test_connect_failure_falls_back_to_memory(self, tmp_path):
+        with _fresh_cache(tmp_path):
+            with patch("utils.persistent_cache.sqlite3.connect", side_effect=sqlite3.OperationalError("ro")):
+                persistent_cache.set("k", [1])
+                assert persistent_cache.get("k", ttl=60) == [1]
+            persistent_cache.set("k2", [2])
+            assert persistent_cache._CONN is not None
@@ -0,0 +1,563 @@
+"""Transport-level tests for signals.quiver_ingest.
+
+The HTTP session is replaced by a fake, so these exercise the real request
+path (throttle hooks, retries, validators, caches) without the network.
+
+Covers:
+  - Startup warm-up (validators, last-good payloads, quota headers)
+  - Persistent-cache hits restoring last-good payloads and validators
+  - 429 handling and Retry-After
+  - Per-endpoint circuit breaker
+  - ETag / 304 reuse
+  - Stale-while-revalidate
+  - Single-flight for heavy endpoints and per-URL requests
+  - Negative cache and the persisted per-symbol WSB memo
+  - Warm-cache probes used to skip the feature extractor pool
+  - Superseded payloads released by the per-payload memo tables
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utils import cache
+
+# time.sleep is patched out while the module under test runs; helpers that
+# really need to wait keep the original.
+_REAL_SLEEP = time.sleep
+
+
+# ---------------------------------------------------------------------------
+# helpers
+# ---------------------------------------------------------------------------
+
+def _response(status: int = 200, payload=None, headers: dict | None = None):
+    r = MagicMock()
+    r.status_code = status
+    r.ok = 200 <= status < 300
+    r.headers = headers or {}
+    r.content = json.dumps(payload if payload is not None else []).encode()
+    return r
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        _REAL_SLEEP(0.01)
+
+
+@contextlib.contextmanager
+def _isolated_ingest(responses):
+    """Run quiver_ingest against ``responses`` with fresh module state.
+
+    ``responses`` is a callable ``(url, headers) -> response``.  Yields a
+    namespace with the fake ``_SESSION.get`` (``get``), the patched
+    ``note_rate_limit_headers`` (``quota``) and the dict standing in for the
+    on-disk cache (``disk``: key -> (data, ts)).
+    """
+    from signals import quiver_ingest
+
+    state = (
+        quiver_ingest._ENDPOINT_SUPPRESS,
+        quiver_ingest._ENDPOINT_FAILURES,
+        quiver_ingest._VALIDATORS,
+        quiver_ingest._LAST_GOOD,
+        quiver_ingest._INFLIGHT,
+        quiver_ingest._INDEX_CACHE,
+    )
+    for d in state:
+        d.clear()
+    cache.reset()
+    get = MagicMock(side_effect=lambda url, timeout=None, headers=None: responses(url, headers))
+    quota = MagicMock()
+    disk: dict = {}
+
+    def disk_get_item(key, ttl=None):
+        item = disk.get(key)
+        if item is None or item[0] is None:
+            return None
+        if ttl is not None and time.time() - item[1] > ttl:
+            return None
+        return item
+
+    def disk_get(key, ttl=None):
+        item = disk_get_item(key, ttl)
+        return item[0] if item is not None else None
+
+    try:
+        with patch.multiple(
+            "signals.quiver_ingest",
+            throttled_request=lambda fn, *a, **k: fn(*a, **k),
+            note_rate_limit_headers=quota,
+            note_rate_limited=MagicMock(),
+            note_success=MagicMock(),
+            persist_get=disk_get,
+            persist_get_item=disk_get_item,
+            persist_set=lambda key, data: disk.__setitem__(key, (data, time.time())),
+        ), patch.object(quiver_ingest._SESSION, "get", get), patch(
+            "signals.quiver_ingest.time.sleep"
+        ):
+            yield SimpleNamespace(get=get, quota=quota, disk=disk)
+    finally:
+        for d in state:
+            d.clear()
+        cache.reset()
+
+
+# ============================================================================
+# 1. Startup warm-up
+# ============================================================================
+
+class TestWarmup:
+    def test_warmup_records_validators_last_good_and_quota(self):
+        from signals import quiver_ingest
+
+        headers = {"ETag": '"v1"', "X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "30"}
+        row = {"Ticker": "AAPL", "Date": "2024-01-02"}
+        with _isolated_ingest(lambda url, h: _response(200, [row], headers)) as io:
+            status = quiver_ingest.initialize_quiver_caches()
+
+            names = [name for name, _ in quiver_ingest.HEAVY_ENDPOINTS]
+            assert status == {name: True for name in names}
+            assert io.get.call_count == len(names)
+            assert io.quota.call_count == len(names)
+            io.quota.assert_called_with(headers)
+            for name in names:
+                assert quiver_ingest._VALIDATORS[name][0] == '"v1"'
+                assert quiver_ingest._LAST_GOOD[name][1] == [row]
+
+    def test_warm_cache_skips_downloads(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(200, [{"Ticker": "AAPL"}])) as io:
+            quiver_ingest.initialize_quiver_caches()
+            first = io.get.call_count
+            quiver_ingest.initialize_quiver_caches()
+            assert io.get.call_count == first
+
+    def test_failed_endpoint_reported(self):
+        from signals import quiver_ingest
+
+        def responses(url, headers):
+            if url.endswith("/live/sec13f"):
+                return _response(500)
+            return _response(200, [{"Ticker": "AAPL"}])
+
+        with _isolated_ingest(responses):
+            status = quiver_ingest.initialize_quiver_caches()
+            assert status["live_sec13f"] is False
+            assert status["live_insiders"] is True
+            assert "live_sec13f" in quiver_ingest._ENDPOINT_FAILURES
+
+
+# ============================================================================
+# 2. Persistent-cache hits
+# ============================================================================
+
+class TestPersistentHit:
+    URL_PATH = "/live/insiders"
+
+    def _download_then_restart(self, quiver_ingest, io):
+        url = f"{quiver_ingest.QUIVER_BASE_URL}{self.URL_PATH}"
+        quiver_ingest._cached_heavy_endpoint("live_insiders", url, ttl=60)
+        # A new process: memory is empty, only the disk layer survives.
+        quiver_ingest._VALIDATORS.clear()
+        quiver_ingest._LAST_GOOD.clear()
+        cache.reset()
+        return url
+
+    def test_disk_hit_seeds_last_good_and_validators(self):
+        from signals import quiver_ingest
+
+        rows = [{"Ticker": "AAPL"}]
+        headers = {"ETag": '"v7"', "Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"}
+        with _isolated_ingest(lambda url, h: _response(200, rows, headers)) as io:
+            url = self._download_then_restart(quiver_ingest, io)
+            stored_ts = io.disk[quiver_ingest._daily_cache_key("live_insiders")][1]
+
+            assert quiver_ingest._cached_heavy_endpoint("live_insiders", url, ttl=60) == rows
+            assert io.get.call_count == 1
+            assert quiver_ingest._LAST_GOOD["live_insiders"] == (stored_ts, rows)
+            assert quiver_ingest._VALIDATORS["live_insiders"] == (
+                '"v7"',
+                "Tue, 02 Jan 2024 00:00:00 GMT",
+                rows,
+            )
+            assert quiver_ingest._conditional_headers("live_insiders") == {
+                "If-None-Match": '"v7"',
+                "If-Modified-Since": "Tue, 02 Jan 2024 00:00:00 GMT",
+            }
+
+    def test_validators_of_another_payload_ignored(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(200, [{"Ticker": "AAPL"}], {"ETag": '"v1"'})) as io:
+            url = self._download_then_restart(quiver_ingest, io)
+            io.disk["quiver_val:live_insiders"] = (['"v0"', None, "quiver:live_insiders:2000-01-01"], time.time())
+
+            quiver_ingest._cached_heavy_endpoint("live_insiders", url, ttl=60)
+            assert "live_insiders" not in quiver_ingest._VALIDATORS
+            assert "live_insiders" in quiver_ingest._LAST_GOOD
+
+
+# ============================================================================
+# 3. 429 / Retry-After
+# ============================================================================
+
+class TestRetryAfter:
+    URL = "https://api.quiverquant.com/beta/live/insiders"
+
+    def test_retry_after_seconds_honoured(self):
+        from signals import quiver_ingest
+
+        replies = iter([_response(429, headers={"Retry-After": "5"}), _response(200, [{"Ticker": "A"}])])
+        with _isolated_ingest(lambda url, h: next(replies)) as io, patch(
+            "signals.quiver_ingest.random.uniform", return_value=0.0
+        ):
+            assert quiver_ingest.safe_quiver_request(self.URL) == [{"Ticker": "A"}]
+            assert io.get.call_count == 2
+            quiver_ingest.time.sleep.assert_called_once_with(5.0)
+            quiver_ingest.note_rate_limited.assert_called_once()
+
+    def test_retry_after_http_date(self):
+        from signals import quiver_ingest
+
+        assert quiver_ingest._retry_after_seconds({"Retry-After": "Tue, 02 Jan 2001 00:00:00 GMT"}) == 0.0
+        assert quiver_ingest._retry_after_seconds({"Retry-After": "junk"}) is None
+        assert quiver_ingest._retry_after_seconds({}) is None
+
+    def test_retry_after_above_cap_gives_up(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(429, headers={"Retry-After": "600"})) as io:
+            with pytest.raises(quiver_ingest.QuiverRateLimitError):
+                quiver_ingest.safe_quiver_request(self.URL, retries=3, cap=60)
+            assert io.get.call_count == 1
+            quiver_ingest.time.sleep.assert_not_called()
+
+    def test_rate_limit_opens_circuit_for_heavy_endpoint(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(429)):
+            assert quiver_ingest._cached_heavy_endpoint("live_insiders", self.URL, ttl=3600) is None
+            assert quiver_ingest._suppression_left("live_insiders") > 0
+
+
+# ============================================================================
+# 4. Circuit breaker
+# ============================================================================
+
+class TestCircuitBreaker:
+    URL = "https://api.quiverquant.com/beta/live/sec13f"
+
+    def test_open_circuit_skips_requests(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(500)) as io:
+            assert quiver_ingest._cached_heavy_endpoint("live_sec13f", self.URL, ttl=3600) is None
+            calls = io.get.call_count
+            assert quiver_ingest._cached_heavy_endpoint("live_sec13f", self.URL, ttl=3600) is None
+            assert io.get.call_count == calls
+
+    def test_cooldown_doubles_up_to_ttl(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(500)), patch(
+            "signals.quiver_ingest.time.monotonic", return_value=1000.0
+        ):
+            reset = quiver_ingest._BREAKER_RESET_SEC
+            assert quiver_ingest._record_failure("x", 3600) == reset
+            assert quiver_ingest._record_failure("x", 3600) == reset * 2
+            assert quiver_ingest._record_failure("x", 3600) == reset * 4
+            assert quiver_ingest._record_failure("x", reset * 5) == reset * 5
+
+    def test_probe_after_cooldown_closes_circuit(self):
+        from signals import quiver_ingest
+
+        healthy = {"ok": False}
+
+        def responses(url, headers):
+            return _response(200, [{"Ticker": "A"}]) if healthy["ok"] else _response(500)
+
+        with _isolated_ingest(responses) as io:
+            now = [1000.0]
+            with patch("signals.quiver_ingest.time.monotonic", side_effect=lambda: now[0]):
+                quiver_ingest._cached_heavy_endpoint("live_sec13f", self.URL, ttl=3600)
+                healthy["ok"] = True
+                now[0] += quiver_ingest._BREAKER_RESET_SEC + 1
+                assert quiver_ingest._cached_heavy_endpoint("live_sec13f", self.URL, ttl=3600) == [{"Ticker": "A"}]
+            assert "live_sec13f" not in quiver_ingest._ENDPOINT_FAILURES
+            assert quiver_ingest._suppression_left("live_sec13f") == 0.0
+            assert io.get.call_count == 2
+
+
+# ============================================================================
+# 5. ETag / 304 reuse
+# ============================================================================
+
+class TestConditionalRefetch:
+    URL = "https://api.quiverquant.com/beta/live/insiders"
+
+    def test_304_reuses_payload_and_restarts_ttl(self):
+        from signals import quiver_ingest
+
+        rows = [{"Ticker": "AAPL"}]
+        seen = []
+
+        def responses(url, headers):
+            seen.append(headers)
+            if headers and headers.get("If-None-Match") == '"v1"':
+                return _response(304)
+            return _response(200, rows, {"ETag": '"v1"'})
+
+        with _isolated_ingest(responses) as io:
+            key = quiver_ingest._daily_cache_key("live_insiders")
+            first = quiver_ingest._fetch_heavy_endpoint("live_insiders", self.URL, 60, key)
+            cache.reset()
+            io.disk.clear()
+            second = quiver_ingest._fetch_heavy_endpoint("live_insiders", self.URL, 60, key)
+
+            assert seen == [None, {"If-None-Match": '"v1"'}]
+            assert second is first
+            assert cache.get(key, 60) is first
+            assert io.disk[key][0] is first
+
+    def test_response_without_validators_forgets_old_ones(self):
+        from signals import quiver_ingest
+
+        replies = iter([_response(200, [1], {"ETag": '"v1"'}), _response(200, [2])])
+        with _isolated_ingest(lambda url, h: next(replies)):
+            key = quiver_ingest._daily_cache_key("live_insiders")
+            quiver_ingest._fetch_heavy_endpoint("live_insiders", self.URL, 60, key)
+            quiver_ingest._fetch_heavy_endpoint("live_insiders", self.URL, 60, key)
+            assert quiver_ingest._conditional_headers("live_insiders") is None
+
+    def test_304_without_validators_counts_as_failure(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(304)) as io:
+            key = quiver_ingest._daily_cache_key("live_insiders")
+            assert quiver_ingest._fetch_heavy_endpoint("live_insiders", self.URL, 60, key) is None
+            assert quiver_ingest._suppression_left("live_insiders") > 0
+            assert key not in io.disk
+
+
+# ============================================================================
+# 6. Stale-while-revalidate
+# ============================================================================
+
+class TestStaleWhileRevalidate:
+    URL = "https://api.quiverquant.com/beta/live/insiders"
+
+    def test_stale_payload_served_and_refreshed(self):
+        from signals import quiver_ingest
+
+        release = threading.Event()
+
+        def responses(url, headers):
+            release.wait(5)
+            return _response(200, [{"Ticker": "NEW"}])
+
+        with _isolated_ingest(responses) as io:
+            old = [{"Ticker": "OLD"}]
+            quiver_ingest._LAST_GOOD["live_insiders"] = (time.time() - 90, old)
+
+            assert quiver_ingest._cached_heavy_endpoint("live_insiders", self.URL, ttl=60) is old
+            assert "live_insiders" in quiver_ingest._INFLIGHT
+            # A second miss while the refresh runs does not start another one.
+            assert quiver_ingest._cached_heavy_endpoint("live_insiders", self.URL, ttl=60) is old
+            release.set()
+            _wait_for(lambda: "live_insiders" not in quiver_ingest._INFLIGHT)
+
+            assert io.get.call_count == 1
+            assert quiver_ingest._cached_heavy_endpoint("live_insiders", self.URL, ttl=60) == [{"Ticker": "NEW"}]
+
+    def test_open_circuit_serves_stale_without_refresh(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(200, [{"Ticker": "NEW"}])) as io:
+            old = [{"Ticker": "OLD"}]
+            quiver_ingest._LAST_GOOD["live_insiders"] = (time.time() - 90, old)
+            quiver_ingest._suppress_endpoint("live_insiders", 60)
+
+            assert quiver_ingest._cached_heavy_endpoint("live_insiders", self.URL, ttl=60) is old
+            assert "live_insiders" not in quiver_ingest._INFLIGHT
+            assert io.get.call_count == 0
+
+    def test_too_old_payload_blocks_on_download(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(200, [{"Ticker": "NEW"}])):
+            quiver_ingest._LAST_GOOD["live_insiders"] = (time.time() - 200, [{"Ticker": "OLD"}])
+            assert quiver_ingest._cached_heavy_endpoint("live_insiders", self.URL, ttl=60) == [{"Ticker": "NEW"}]
+
+
+# ============================================================================
+# 7. Single-flight
+# ============================================================================
+
+class TestSingleFlight:
+    URL = "https://api.quiverquant.com/beta/live/insiders"
+
+    def _concurrent(self, fn, n: int = 6) -> list:
+        results: list = [None] * n
+
+        def run(i):
+            results[i] = fn()
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        return results
+
+    def _slow(self, payload):
+        def responses(url, headers):
+            _REAL_SLEEP(0.05)
+            return _response(200, payload)
+
+        return responses
+
+    def test_cold_heavy_endpoint_downloaded_once(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(self._slow([{"Ticker": "A"}])) as io:
+            results = self._concurrent(
+                lambda: quiver_ingest._cached_heavy_endpoint("live_insiders", self.URL, ttl=60)
+            )
+            assert io.get.call_count == 1
+            assert results == [[{"Ticker": "A"}]] * len(results)
+
+    def test_per_url_request_downloaded_once(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(self._slow([{"Ticker": "A"}])) as io:
+            url = f"{quiver_ingest.QUIVER_BASE_URL}/historical/wallstreetbets/AAPL"
+            results = self._concurrent(lambda: quiver_ingest._request_or_default(url, ttl=60))
+            assert io.get.call_count == 1
+            assert results == [[{"Ticker": "A"}]] * len(results)
+
+
+# ============================================================================
+# 8. Negative cache
+# ============================================================================
+
+class TestNegativeCache:
+    def test_404_remembered(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(404)) as io:
+            url = f"{quiver_ingest.QUIVER_BASE_URL}/historical/wallstreetbets/ZZZZ"
+            assert quiver_ingest._request_or_default(url, default="dflt") == []
+            assert quiver_ingest._request_or_default(url, default="dflt") == []
+            assert io.get.call_count == 1
+
+    def test_failure_remembered_as_default(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(500)) as io:
+            url = f"{quiver_ingest.QUIVER_BASE_URL}/historical/wallstreetbets/ZZZZ"
+            assert quiver_ingest._request_or_default(url, default="dflt") == "dflt"
+            calls = io.get.call_count
+            assert quiver_ingest._request_or_default(url, default="dflt") == "dflt"
+            assert io.get.call_count == calls
+
+    def test_negative_entry_expires(self):
+        from signals import quiver_ingest
+
+        replies = iter([_response(404), _response(200, [{"Ticker": "ZZZZ"}])])
+        with _isolated_ingest(lambda url, h: next(replies)):
+            url = f"{quiver_ingest.QUIVER_BASE_URL}/historical/wallstreetbets/ZZZZ"
+            quiver_ingest._request_or_default(url)
+            neg_key = quiver_ingest.CACHE_KEYS["negative"].format(url=url)
+            cache._store[neg_key] = (cache._store[neg_key][0], time.time() - 10 * quiver_ingest._ttl_negative())
+            assert quiver_ingest._request_or_default(url) == [{"Ticker": "ZZZZ"}]
+
+    def test_wsb_history_persisted(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(200, [{"Ticker": "AAPL"}])) as io:
+            quiver_ingest.fetch_historical_wallstreetbets("aapl")
+            cache.reset()
+            assert quiver_ingest.fetch_historical_wallstreetbets("AAPL") == [{"Ticker": "AAPL"}]
+            assert io.get.call_count == 1
+
+
+# ============================================================================
+# 9. Warm-cache probes
+# ============================================================================
+
+class TestCachedProbes:
+    URL = "https://api.quiverquant.com/beta/live/insiders"
+
+    def test_heavy_endpoint_cached(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(200, [{"Ticker": "A"}])):
+            assert not quiver_ingest.heavy_endpoint_cached("live_insiders")
+            quiver_ingest._cached_heavy_endpoint("live_insiders", self.URL)
+            assert quiver_ingest.heavy_endpoint_cached("live_insiders")
+
+    def test_open_circuit_counts_as_cached(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(500)):
+            quiver_ingest._cached_heavy_endpoint("live_insiders", self.URL)
+            assert quiver_ingest.heavy_endpoint_cached("live_insiders")
+
+    def test_wallstreetbets_cached(self):
+        from signals import quiver_ingest
+
+        with _isolated_ingest(lambda url, h: _response(404)):
+            assert not quiver_ingest.wallstreetbets_cached("AAPL")
+            quiver_ingest.fetch_historical_wallstreetbets("aapl")
+            assert quiver_ingest.wallstreetbets_cached("AAPL")
+
+
+# ============================================================================
+# 10. Superseded payloads
+# ============================================================================
+
+class TestSupersededPayloads:
+    URL = "https://api.quiverquant.com/beta/live/insiders"
+
+    def test_refill_drops_old_payload_index_and_notifies_hooks(self):
+        from signals import quiver_ingest
+
+        replies = iter([_response(200, [{"Ticker": "OLD"}]), _response(200, [{"Ticker": "NEW"}])])
+        retired = []
+        with _isolated_ingest(lambda url, h: next(replies)), patch.object(
+            quiver_ingest, "_RETIRE_HOOKS", [retired.append]
+        ):
+            key = quiver_ingest._daily_cache_key("live_insiders")
+            old = quiver_ingest._fetch_heavy_endpoint("live_insiders", self.URL, 60, key)
+            assert id(old) in quiver_ingest._INDEX_CACHE
+            new = quiver_ingest._fetch_heavy_endpoint("live_insiders", self.URL, 60, key)
+
+            assert len(retired) == 1 and retired[0] is old
+            assert id(new) in quiver_ingest._INDEX_CACHE
+            assert all(hit[0] is not old for hit in quiver_ingest._INDEX_CACHE.values())
+
+    def test_304_keeps_payload_indexed(self):
+        from signals import quiver_ingest
+
+        replies = iter([_response(200, [{"Ticker": "A"}], {"ETag": '"v1"'}), _response(304)])
+        retired = []
+        with _isolated_ingest(lambda url, h: next(replies)), patch.object(
+            quiver_ingest, "_RETIRE_HOOKS", [retired.append]
+        ):
+            key = quiver_ingest._daily_cache_key("live_insiders")
+            first = quiver_ingest._fetch_heavy_endpoint("live_insiders", self.URL, 60, key)
+            quiver_ingest._fetch_heavy_endpoint("live_insiders", self.URL, 60, key)
+
+            assert retired == []
+            assert quiver_ingest._INDEX_CACHE[id(first)][0] is first
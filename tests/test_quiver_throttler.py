@@ -0,0 +1,190 @@
+"""Deterministic tests for signals.quiver_throttler.
+
+The module's ``time`` is replaced by a fake clock whose ``sleep`` advances
+``monotonic`` instead of waiting, so token refills and pauses are exact.
+
+Covers:
+  - TokenBucket bursts, refill and waits
+  - AIMD backoff on 429 and gradual recovery
+  - X-RateLimit-Remaining / X-RateLimit-Reset pause (PAUSE_UNTIL)
+"""
+
+from __future__ import annotations
+
+import contextlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from signals import quiver_throttler
+
+
+# ---------------------------------------------------------------------------
+# helpers
+# ---------------------------------------------------------------------------
+
+class _Clock:
+    def __init__(self, start: float = 1000.0, wall: float = 1_700_000_000.0):
+        self.now = start
+        self.wall = wall
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.wall + self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@contextlib.contextmanager
+def _fake_clock(rate: float = 1.0, burst: int = 3):
+    """Fresh bucket and pause state driven by a fake clock."""
+    clock = _Clock()
+    with patch.object(quiver_throttler, "time", clock):
+        bucket = quiver_throttler.TokenBucket(rate=rate, burst=burst)
+        with patch.object(quiver_throttler, "_BUCKET", bucket), patch.object(
+            quiver_throttler, "PAUSE_UNTIL", 0.0
+        ), patch.object(quiver_throttler, "log_once"):
+            yield clock, bucket
+
+
+# ============================================================================
+# 1. Token bucket
+# ============================================================================
+
+class TestTokenBucket:
+    def test_burst_then_steady_rate(self):
+        with _fake_clock(rate=2.0, burst=3) as (clock, bucket):
+            for _ in range(3):
+                bucket.acquire()
+            assert clock.sleeps == []
+            bucket.acquire()
+            assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_idle_time_refills_up_to_burst(self):
+        with _fake_clock(rate=1.0, burst=3) as (clock, bucket):
+            for _ in range(3):
+                bucket.acquire()
+            clock.advance(100.0)
+            for _ in range(3):
+                bucket.acquire()
+            assert clock.sleeps == []
+            bucket.acquire()
+            assert clock.sleeps == [pytest.approx(1.0)]
+
+    def test_waiters_queue_behind_each_other(self):
+        with _fake_clock(rate=1.0, burst=1) as (clock, bucket):
+            bucket.acquire()
+            # Tokens are reserved before sleeping, so back-to-back callers
+            # that have not slept yet are spaced one interval apart.
+            with patch.object(clock, "sleep") as sleep:
+                bucket.acquire()
+                bucket.acquire()
+            assert [c.args[0] for c in sleep.call_args_list] == [
+                pytest.approx(1.0),
+                pytest.approx(2.0),
+            ]
+
+
+# ============================================================================
+# 2. AIMD backoff / recovery
+# ============================================================================
+
+class TestAimd:
+    def test_backoff_halves_rate_down_to_floor(self):
+        with _fake_clock(rate=8.0) as (_, bucket):
+            assert bucket.backoff() == pytest.approx(4.0)
+            assert bucket.backoff() == pytest.approx(2.0)
+            assert bucket.backoff() == pytest.approx(1.0)
+            assert bucket.backoff() == pytest.approx(1.0)  # min_rate = rate / 8
+            assert bucket.rate == pytest.approx(bucket.min_rate)
+
+    def test_recover_adds_tenth_of_max_up_to_max(self):
+        with _fake_clock(rate=10.0) as (_, bucket):
+            bucket.backoff()
+            bucket.recover()
+            assert bucket.rate == pytest.approx(6.0)
+            for _ in range(10):
+                bucket.recover()
+            assert bucket.rate == pytest.approx(10.0)
+
+    def test_backoff_slows_acquire(self):
+        with _fake_clock(rate=2.0, burst=1) as (clock, bucket):
+            bucket.acquire()
+            bucket.backoff()
+            bucket.acquire()
+            assert clock.sleeps == [pytest.approx(1.0)]
+
+    def test_module_hooks_drive_shared_bucket(self):
+        with _fake_clock(rate=1.0) as (_, bucket):
+            quiver_throttler.note_rate_limited()
+            assert bucket.rate == pytest.approx(0.5)
+            quiver_throttler.note_success()
+            assert bucket.rate == pytest.approx(0.6)
+            quiver_throttler.log_once.assert_called_once()
+
+
+# ============================================================================
+# 3. Quota headers pause
+# ============================================================================
+
+class TestQuotaPause:
+    def test_exhausted_quota_pauses_next_request(self):
+        with _fake_clock() as (clock, _):
+            quiver_throttler.note_rate_limit_headers(
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "10"}
+            )
+            assert quiver_throttler.PAUSE_UNTIL == pytest.approx(clock.now + 10)
+
+            request = MagicMock(return_value="ok")
+            assert quiver_throttler.throttled_request(request, "url") == "ok"
+            assert clock.sleeps == [pytest.approx(10.0)]
+            request.assert_called_once_with("url")
+
+    def test_epoch_reset_converted_to_delay(self):
+        with _fake_clock() as (clock, _):
+            quiver_throttler.note_rate_limit_headers(
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(clock.time() + 20)}
+            )
+            assert quiver_throttler.PAUSE_UNTIL - clock.now == pytest.approx(20.0)
+
+    def test_pause_capped_at_sixty_seconds(self):
+        with _fake_clock() as (clock, _):
+            quiver_throttler.note_rate_limit_headers(
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3600"}
+            )
+            assert quiver_throttler.PAUSE_UNTIL - clock.now == pytest.approx(60.0)
+
+    def test_pause_never_shortened(self):
+        with _fake_clock() as (clock, _):
+            quiver_throttler.note_rate_limit_headers(
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}
+            )
+            quiver_throttler.note_rate_limit_headers(
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"}
+            )
+            assert quiver_throttler.PAUSE_UNTIL - clock.now == pytest.approx(30.0)
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "10"},
+            {"X-RateLimit-Remaining": "0"},
+            {"X-RateLimit-Remaining": "n/a", "X-RateLimit-Reset": "10"},
+            MagicMock(),
+            None,
+        ],
+    )
+    def test_no_pause_without_exhausted_quota(self, headers):
+        with _fake_clock() as (clock, _):
+            quiver_throttler.note_rate_limit_headers(headers)
+            assert quiver_throttler.PAUSE_UNTIL == 0.0
+            quiver_throttler.throttled_request(MagicMock())
+            assert clock.sleeps == []
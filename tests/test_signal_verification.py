@@ -286,6 +286,22 @@ class TestQuiverEndpointParsing:
         f = self._run_utils(payload)
         assert f["quiver_insider_buy_count"] == 0, "Stale insider buy should be ignored"
 
+    def test_insider_stale_ignored_when_pandas_cannot_parse_dates(self):
+        """pandas < 2.0 coerces every date to NaT under format="ISO8601"."""
+        import pandas as pd
+        from signals import quiver_utils
+
+        def all_nat(values, **kwargs):
+            return pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns, UTC]")
+
+        payload = {"insiders": [
+            {"Ticker": "AAPL", "TransactionCode": "P", "Date": "2020-01-01"},
+            {"Ticker": "AAPL", "TransactionCode": "P", "Date": self._recent_date(2)},
+        ]}
+        with patch.object(quiver_utils.pd, "to_datetime", side_effect=all_nat):
+            f = self._run_utils(payload)
+        assert f["quiver_insider_buy_count"] == 1, "Stale insider buy should be ignored"
+
     def test_insider_wrong_ticker_ignored(self):
         payload = {"insiders": [
             {"Ticker": "MSFT", "TransactionCode": "P", "Date": self._recent_date(1)},
@@ -413,6 +429,21 @@ class TestQuiverEndpointParsing:
         f = self._run_utils({"sec13fchanges": []})
         assert f["quiver_sec13f_change_latest_pct"] == 0.0
 
+    def test_sec13f_unparseable_report_date_falls_back_to_date(self):
+        payload = {"sec13fchanges": [
+            {"Ticker": "AAPL", "Change_Pct": 7.0, "ReportDate": "N/A", "Date": self._recent_date(1)},
+            {"Ticker": "AAPL", "Change_Pct": 3.0, "ReportDate": self._recent_date(4)},
+        ]}
+        f = self._run_utils(payload)
+        assert f["quiver_sec13f_change_latest_pct"] == pytest.approx(7.0)
+
+    def test_sec13f_stale_date_behind_unparseable_report_date_ignored(self):
+        payload = {"sec13f": [
+            {"Ticker": "AAPL", "ReportDate": "Q3 2019", "Date": "2019-09-30"},
+        ]}
+        f = self._run_utils(payload)
+        assert f["quiver_sec13f_count"] == 0
+
     # --- wallstreetbets ---
     def test_wsb_max_mentions_parsed(self):
         payload = {"wsb": [
@@ -575,6 +606,79 @@ class TestFastLane:
         assert strong, "patent momentum >= 1.0 should trigger fast lane"
         assert "patent_momentum" in reasons
 
+    def _scan_below_floor(self, symbol: str = "TINY"):
+        from signals import reader
+
+        entry = {"ticker_map": {"canonical": symbol, "yahoo": symbol, "quiver": symbol}}
+        # market cap, volume, weekly change, trend, 24h change, 7d volume, price, ATR
+        snapshot = (1_000_000.0, 1_000.0, 0.0, True, 0.0, 1_000.0, 10.0, 0.2)
+        policy = {
+            "yahoo_gate": {
+                "min_market_cap": 2_000_000_000,
+                "min_avg_volume_7d": 500_000,
+                "relaxed_min_market_cap": 300_000_000,
+                "relaxed_min_avg_volume_7d": 50_000,
+            },
+            "quiver_gate": {"fast_lane_enabled": True},
+        }
+        features = MagicMock()
+        with patch.object(config, "ENABLE_QUIVER", True), \
+                patch("signals.reader._cycle_batch", return_value=[entry]), \
+                patch("signals.reader.gate_market_conditions", return_value=(True, [], {})), \
+                patch("signals.reader._fetch_yahoo_snapshot",
+                      return_value=(snapshot, None, {"status": "ok", "used_symbol": symbol})), \
+                patch("signals.reader.get_symbol_features", features), \
+                patch("signals.reader.log_event"):
+            _with_policy(policy, lambda: reader.get_top_signals(max_symbols=1))
+        return features
+
+    def test_below_loosest_floor_rejected_before_quiver(self):
+        features = self._scan_below_floor()
+        features.assert_not_called()
+
+    def test_floor_rejection_clears_pending_fast_lane(self):
+        from signals import reader
+
+        with patch.dict(reader._fast_lane_pending, {"TINY": 0.0}):
+            self._scan_below_floor("TINY")
+            assert "TINY" not in reader._fast_lane_pending
+
+    def test_prefiltered_symbols_prefetched_in_one_batch(self):
+        from signals import reader
+
+        universe = [
+            {"ticker_map": {"canonical": "AAPL", "yahoo": "AAPL", "quiver": "AAPL"}},
+            {"ticker_map": {"canonical": "BRK.B", "yahoo": "BRK-B", "quiver": "BRK.B"}},
+            {"ticker_map": {"canonical": "TINY", "yahoo": "TINY", "quiver": "TINY"}},
+        ]
+        big = (5e9, 1e6, 0.0, True, 0.0, 1e6, 50.0, 1.0)
+        tiny = (1e6, 1e3, 0.0, True, 0.0, 1e3, 10.0, 0.2)
+
+        def yahoo(symbol, yahoo_symbol):
+            snapshot = tiny if symbol == "TINY" else big
+            return snapshot, None, {"status": "ok", "used_symbol": yahoo_symbol}
+
+        policy = {
+            "yahoo_gate": {
+                "min_market_cap": 2_000_000_000,
+                "min_avg_volume_7d": 500_000,
+                "relaxed_min_market_cap": 300_000_000,
+                "relaxed_min_avg_volume_7d": 50_000,
+            },
+        }
+        batch = MagicMock(return_value={})
+        features = MagicMock(return_value={})
+        with patch.object(config, "ENABLE_QUIVER", True), \
+                patch("signals.reader._cycle_batch", return_value=universe), \
+                patch("signals.reader.gate_market_conditions", return_value=(True, [], {})), \
+                patch("signals.reader._fetch_yahoo_snapshot", side_effect=yahoo), \
+                patch("signals.quiver_utils.fetch_quiver_signals_batch", batch), \
+                patch("signals.reader.get_symbol_features", features), \
+                patch("signals.reader.log_event"):
+            _with_policy(policy, lambda: reader.get_top_signals(max_symbols=3))
+        batch.assert_called_once_with(["AAPL", "BRK.B"], fallbacks={"BRK.B": "BRK-B"})
+        assert [c.args[0] for c in features.call_args_list] == ["AAPL", "BRK.B"]
+
     def test_fast_lane_patent_1_0_is_reachable(self):
         """Verify the threshold is now achievable (old threshold of 90 was not)."""
         from signals.reader import _FEATURE_CAPS
@@ -728,3 +832,123 @@ class TestScoringCaps:
         score_bad, _ = _score_from_features(bad)
         assert score_good > score_bad, \
             f"More sells should lower score ({score_good:.2f} vs {score_bad:.2f})"
+
+
+# ============================================================================
+# 12. Feature extraction on a warm cache
+# ============================================================================
+
+class TestFeatureExtractionScheduling:
+    def _run(self, warm_names: set, wsb_warm: bool):
+        from signals import quiver_utils
+
+        pool = MagicMock()
+        pool.submit.side_effect = lambda fn, *args: MagicMock(result=MagicMock(return_value=fn(*args)))
+        with patch.multiple("signals.quiver_ingest",
+                            heavy_endpoint_cached=MagicMock(side_effect=lambda name: name in warm_names),
+                            wallstreetbets_cached=MagicMock(return_value=wsb_warm),
+                            fetch_live_insiders=MagicMock(return_value=[]),
+                            fetch_live_govcontractsall_cached=MagicMock(return_value=[]),
+                            fetch_live_govcontracts=MagicMock(return_value=[]),
+                            fetch_live_housetrading=MagicMock(return_value=[]),
+                            fetch_live_patentmomentum_cached=MagicMock(return_value=[]),
+                            fetch_live_sec13f_cached=MagicMock(return_value=[]),
+                            fetch_live_sec13fchanges_cached=MagicMock(return_value=[]),
+                            fetch_live_twitter=MagicMock(return_value=[]),
+                            fetch_live_appratings_cached=MagicMock(return_value=[]),
+                            fetch_live_offexchange_cached=MagicMock(return_value=[]),
+                            fetch_live_senatetrading_cached=MagicMock(return_value=[]),
+                            fetch_live_congresstrading_cached=MagicMock(return_value=[]),
+                            fetch_historical_wallstreetbets=MagicMock(return_value=[])), \
+                patch("signals.quiver_utils._extractor_pool", return_value=pool):
+            features = quiver_utils.get_quiver_features("AAPL")
+        return features, pool
+
+    def test_warm_cache_runs_inline(self):
+        from signals import quiver_utils
+
+        every = {name for _, _, names in quiver_utils._EXTRACTORS for name in names or ()}
+        features, pool = self._run(every, wsb_warm=True)
+        pool.submit.assert_not_called()
+        assert tuple(features) == quiver_utils.QUIVER_FEATURE_KEYS
+
+    def test_only_cold_extractors_use_pool(self):
+        from signals import quiver_utils
+
+        every = {name for _, _, names in quiver_utils._EXTRACTORS for name in names or ()}
+        features, pool = self._run(every - {"live_insiders"}, wsb_warm=False)
+        submitted = [c.args[1] for c in pool.submit.call_args_list]
+        assert submitted == [quiver_utils._insider_trade_features, quiver_utils._wsb_features]
+        assert tuple(features) == quiver_utils.QUIVER_FEATURE_KEYS
+
+
+# ============================================================================
+# 13. Columnar views of replaced payloads
+# ============================================================================
+
+class TestColumnsCacheEviction:
+    def test_replaced_payload_columns_dropped(self):
+        from signals import quiver_ingest, quiver_utils
+
+        old = [{"Ticker": "AAPL", "Date": "2024-01-02"}]
+        new = [{"Ticker": "AAPL", "Date": "2024-01-03"}]
+        with patch.dict(quiver_ingest._LAST_GOOD, clear=True), \
+                patch.dict(quiver_utils._COLUMNS_CACHE, clear=True):
+            quiver_ingest._store_last_good("live_insiders", 1.0, old)
+            quiver_utils._columns_for(old, "AAPL", ("Date",))
+            quiver_ingest._store_last_good("live_insiders", 2.0, new)
+            quiver_utils._columns_for(new, "AAPL", ("Date",))
+
+            held = [hit[0] for hit in quiver_utils._COLUMNS_CACHE.values()]
+            assert len(held) == 1 and held[0] is new
+
+
+# ============================================================================
+# 14. Batched feature lookups
+# ============================================================================
+
+class TestFeatureBatchLookup:
+    def _run(self, fn, cached: dict, computed: dict):
+        """Run ``fn`` over a dict standing in for the feature cache."""
+        from signals import quiver_utils
+
+        store = {quiver_utils._features_key(sym): f for sym, f in cached.items()}
+        batch = MagicMock(side_effect=lambda syms: {sym: computed[sym] for sym in syms})
+        with patch.object(config, "ENABLE_QUIVER", True), \
+                patch.multiple("signals.quiver_utils",
+                               _cached_features=MagicMock(side_effect=lambda key, ttl: store.get(key)),
+                               _store_features=MagicMock(side_effect=store.__setitem__),
+                               get_quiver_features_batch=batch,
+                               get_quiver_features=lambda sym: batch([sym])[sym]):
+            return fn(), store, batch
+
+    def test_only_misses_computed_in_one_batch(self):
+        from signals import quiver_utils
+
+        hit = {"quiver_insider_buy_count": 1}
+        computed = {"MSFT": {"quiver_insider_buy_count": 2}, "TSLA": {"quiver_insider_buy_count": 0}}
+        result, store, batch = self._run(
+            lambda: quiver_utils.fetch_quiver_signals_batch(["AAPL", "MSFT", "TSLA", "MSFT"]),
+            {"AAPL": hit},
+            computed,
+        )
+        batch.assert_called_once_with(["MSFT", "TSLA"])
+        assert result == {"AAPL": hit, **computed}
+        assert store[quiver_utils._features_key("MSFT")] == computed["MSFT"]
+
+    def test_fallback_matches_single_symbol_path(self):
+        from signals import quiver_utils
+
+        computed = {"BRK.B": {"quiver_insider_buy_count": 0}, "BRK-B": {"quiver_insider_buy_count": 3}}
+        batched, batch_store, _ = self._run(
+            lambda: quiver_utils.fetch_quiver_signals_batch(["BRK.B"], fallbacks={"BRK.B": "BRK-B"}),
+            {},
+            computed,
+        )
+        single, single_store, _ = self._run(
+            lambda: quiver_utils.fetch_quiver_signals("BRK.B", fallback_symbol="BRK-B"),
+            {},
+            computed,
+        )
+        assert batched["BRK.B"] == single == computed["BRK-B"]
+        assert batch_store == single_store
@@ -1,58 +1,182 @@
-"""Lightweight JSON-backed cache with in-memory fallback."""
+"""Lightweight SQLite-backed cache with in-memory fallback.
+
+Each key lives in its own row, so ``set`` writes only the entry that changed
+instead of re-serialising every cached Quiver payload into one JSON file.
+Entries survive process restarts (Render redeploys, crashes) which keeps the
+daily-change Quiver endpoints out of the rate-limit budget after a restart.
+"""
 
 from __future__ import annotations
 
 import json
 import os
+import sqlite3
+import threading
 import time
 from typing import Any
 
+from utils.logger import log_once
+
+try:  # pragma: no cover
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
 
 _CACHE: dict[str, dict[str, Any]] = {}
 _PERSIST_ENABLED = True
-_CACHE_PATH = os.path.join("data", "cache", "quiver_cache.json")
+_CACHE_PATH = os.path.join("data", "cache", "quiver_cache.sqlite")
+# _LOCK guards the in-memory dict only; SQLite I/O runs under _DB_LOCK so a
+# slow commit does not block readers that hit memory.
+_LOCK = threading.Lock()
+_DB_LOCK = threading.Lock()
+_CONN: sqlite3.Connection | None = None
 
 
-def _load_cache() -> None:
-    global _PERSIST_ENABLED
-    if not os.path.exists(_CACHE_PATH):
-        return
+def _connect() -> sqlite3.Connection | None:
+    global _CONN
+    if _CONN is not None or not _PERSIST_ENABLED:
+        return _CONN
     try:
-        with open(_CACHE_PATH, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-        if isinstance(payload, dict):
-            _CACHE.update(payload)
-    except Exception:
-        _PERSIST_ENABLED = False
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(_CACHE_PATH, timeout=5.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts REAL NOT NULL, data TEXT NOT NULL)"
+        )
+        conn.commit()
+        _CONN = conn
+    except Exception as exc:
+        _reset(exc)
+    return _CONN
 
 
-def _flush_cache() -> None:
-    global _PERSIST_ENABLED
-    if not _PERSIST_ENABLED:
-        return
+def _dumps(data) -> bytes | str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data)
+
+
+def _loads(raw):
+    # Rows written by either encoder are readable by both.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _reset(exc: Exception) -> None:
+    """Drop the connection after an error; the next call reconnects."""
+    global _CONN
+    log_once(
+        "persistent_cache_error",
+        f"CACHE persistencia SQLite falló ({exc}); se reintenta en la siguiente llamada",
+        min_interval_sec=300,
+        event="CACHE",
+    )
+    conn, _CONN = _CONN, None
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _read(key: str) -> dict[str, Any] | None:
+    with _DB_LOCK:
+        conn = _connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT ts, data FROM cache WHERE key = ?", (key,)).fetchone()
+        except Exception as exc:
+            _reset(exc)
+            return None
+    if row is None:
+        return None
     try:
-        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
-        with open(_CACHE_PATH, "w", encoding="utf-8") as handle:
-            json.dump(_CACHE, handle)
+        return {"ts": float(row[0]), "data": _loads(row[1])}
     except Exception:
-        _PERSIST_ENABLED = False
+        return None
 
 
-def get(key: str, ttl: int | float | None = None):
-    item = _CACHE.get(key)
+def _write(key: str, item: dict[str, Any]) -> None:
+    # Encoded before taking _DB_LOCK; a payload that cannot be encoded stays
+    # memory-only and the connection is kept.
+    try:
+        raw = _dumps(item["data"])
+    except Exception as exc:
+        log_once(
+            "persistent_cache_encode",
+            f"CACHE {key}: no serializable ({exc}); solo se guarda en memoria",
+            min_interval_sec=300,
+            event="CACHE",
+        )
+        return
+    with _DB_LOCK:
+        with _LOCK:
+            if _CACHE.get(key) is not item:
+                return  # superseded by a newer set(), which writes its own row
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, ts, data) VALUES (?, ?, ?)",
+                (key, item["ts"], raw),
+            )
+            conn.commit()
+        except Exception as exc:
+            _reset(exc)
+
+
+def _delete(key: str) -> None:
+    with _DB_LOCK:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            conn.commit()
+        except Exception as exc:
+            _reset(exc)
+
+
+def get_item(key: str, ttl: int | float | None = None) -> tuple[Any, float] | None:
+    """Return ``(data, ts)`` for a fresh entry, ``ts`` being its ``time.time()`` of writing."""
+    with _LOCK:
+        item = _CACHE.get(key)
+    if item is None:
+        item = _read(key)
+        if item is not None:
+            with _LOCK:
+                item = _CACHE.setdefault(key, item)
     if not item:
         return None
     ts = item.get("ts")
     if ttl is not None and ts is not None and time.time() - float(ts) > ttl:
-        _CACHE.pop(key, None)
-        _flush_cache()
+        with _LOCK:
+            # Only drop the entry we judged expired, not a fresher one a
+            # concurrent set() put in its place.
+            if _CACHE.get(key) is item:
+                del _CACHE[key]
+            else:
+                return None
+        _delete(key)
+        return None
+    data = item.get("data")
+    if data is None:
         return None
-    return item.get("data")
+    return data, float(ts) if ts is not None else time.time()
 
 
-def set(key: str, data) -> None:
-    _CACHE[key] = {"data": data, "ts": time.time()}
-    _flush_cache()
+def get(key: str, ttl: int | float | None = None):
+    hit = get_item(key, ttl)
+    return hit[0] if hit is not None else None
 
 
-_load_cache()
+def set(key: str, data) -> None:
+    item = {"data": data, "ts": time.time()}
+    with _LOCK:
+        _CACHE[key] = item
+    _write(key, item)